@@ -28,15 +28,15 @@ markers = {
 def plot_point_sources(kind, ax, color="black", **kwargs):
     """Plot point sources of a given kind on an axis."""
     points = _load_points()
-    for index, row in points[points["category"] == kind].iterrows():
-        ax.scatter(
-            row["longitude"],
-            row["latitude"],
-            transform=PC,
-            label=row["name"],
-            c=color,
-            marker=markers.get(kind),
-            **kwargs,
-        )
+    subset = points[points["category"] == kind]
+    kwargs.setdefault("label", kind)
+    ax.scatter(
+        subset["longitude"].to_numpy(),
+        subset["latitude"].to_numpy(),
+        transform=PC,
+        c=color,
+        marker=markers.get(kind),
+        **kwargs,
+    )
 
     return ax
@@ -1,6 +1,9 @@
+import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from lair.background import rolling_baseline
 
+from slv.inversion.memo import keyed_lru_cache
 from slv.measurements import aggregate_obs, load_concentrations
 from slv.measurements.background import GMLDiscrete
 
@@ -36,16 +39,36 @@ def get_slv_background(
         raise ValueError(f"Unsupported background: {background}")
 
 
-def get_rolling_background(
+def _hourly_key(sites, site_config, time_range, num_processes=1, filter_pcaps=True):
+    """Cache key for _hourly_site_frame; ``num_processes`` is left out."""
+    return (
+        tuple(sites),
+        tuple(pd.Timestamp(t) for t in time_range),
+        filter_pcaps,
+        int(pd.util.hash_pandas_object(site_config.reindex(sites)).sum()),
+    )
+
+
+@keyed_lru_cache(maxsize=8, key=_hourly_key)
+def _hourly_site_frame(
     sites: list[str],
     site_config: pd.DataFrame,
     time_range: tuple,
     num_processes: int = 1,
     filter_pcaps: bool = True,
-    baseline_window: str = "14d",
-    min_periods: int = int(24 * 3.5),
-) -> pd.Series:
-    """Rolling 1st-percentile baseline applied to in-situ observations."""
+) -> pd.DataFrame:
+    """Hourly CH4 per site (obs_time x site) for the rolling baseline.
+
+    Memoized for the process (LRU, 8 entries) so repeated background builds in
+    MDM/bias/config sweeps skip the load + hourly aggregation. The key covers
+    the sites, time range, PCAP filter and a content hash of the requested
+    site_config rows; ``num_processes`` only changes how the data is read, not
+    what comes back, so it is left out. Treat the returned frame as read-only.
+
+    The unstacked frame is rebuilt around one site-major float array, stored
+    as a single (n_sites, n_times) block, so each site's series -- what the
+    rolling baseline slices per site -- is contiguous in memory.
+    """
     data = load_concentrations(
         pollutants=["CH4"],
         sites=sites,
@@ -63,16 +86,47 @@ def get_rolling_background(
     )
     data = data.rename(columns={"Time_UTC": "obs_time"})
     df = data.set_index(["obs_time", "site"])["CH4"].unstack(fill_value=None)
+    # Lay the values out site-major and wrap them without a copy, so the
+    # single block is (n_sites, n_times) C-order whatever the pandas version
+    by_site = np.ascontiguousarray(df.to_numpy(dtype=float).T)
+    df = pd.DataFrame(by_site.T, index=df.index, columns=df.columns, copy=False)
+    return df
 
-    bg_dict = {}
-    for site in df.columns:
-        bg_dict[site] = rolling_baseline(
-            df[site],
-            window=baseline_window,
-            min_periods=min_periods,
-        )
 
-    bg_df = pd.DataFrame(bg_dict)
+def get_rolling_background(
+    sites: list[str],
+    site_config: pd.DataFrame,
+    time_range: tuple,
+    num_processes: int = 1,
+    filter_pcaps: bool = True,
+    baseline_window: str = "14d",
+    min_periods: int = int(24 * 3.5),
+) -> pd.Series:
+    """Rolling 1st-percentile baseline applied to in-situ observations."""
+    df = _hourly_site_frame(
+        sites=sites,
+        site_config=site_config,
+        time_range=time_range,
+        num_processes=num_processes,
+        filter_pcaps=filter_pcaps,
+    )
+
+    # Sites are independent: fan the per-site baselines out when allowed. pandas'
+    # rolling kernels release the GIL, so threads share the (column-major) frame
+    # without pickling each site series to a worker process.
+    n_jobs = min(num_processes, df.shape[1])
+    if n_jobs > 1:
+        baselines = Parallel(n_jobs=n_jobs, backend="threading")(
+            delayed(rolling_baseline)(
+                df[site], window=baseline_window, min_periods=min_periods
+            )
+            for site in df.columns
+        )
+        bg_df = pd.concat(baselines, axis=1, keys=df.columns)
+    else:
+        bg_df = df.apply(
+            rolling_baseline, window=baseline_window, min_periods=min_periods
+        )
     background = bg_df.mean(axis=1)
     background.name = "concentration"
     background.index.name = "obs_time"
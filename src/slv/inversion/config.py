@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from functools import cached_property
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 import numpy as np
@@ -120,6 +120,65 @@ def build_location_site_map(
     return mapper
 
 
+@lru_cache(maxsize=8)
+def _build_grid(
+    xmin: float, xmax: float, dx: float, ymin: float, ymax: float, dy: float
+):
+    """Regular lon/lat grid with the given bounds and resolution (EPSG:4326).
+
+    Cached on the (hashable) grid parameters so every config in a process that
+    shares a domain reuses one grid; treat the returned grid as read-only.
+    """
+    grid = generate_regular_grid(
+        xmin=xmin,
+        xmax=xmax,
+        dx=dx,
+        ymin=ymin,
+        ymax=ymax,
+        dy=dy,
+        x_label="lon",
+        y_label="lat",
+    )
+    grid = grid.rio.set_spatial_dims(x_dim="lon", y_dim="lat")
+    grid = write_rio_crs(grid, crs="EPSG:4326")
+    return grid
+
+
+@lru_cache(maxsize=8)
+def _build_grid_cells(
+    xmin: float, xmax: float, dx: float, ymin: float, ymax: float, dy: float
+) -> tuple[np.ndarray, pd.MultiIndex]:
+    """``(lon, lat)`` cell-center array and MultiIndex for ``_build_grid``'s grid."""
+    grid = _build_grid(xmin, xmax, dx, ymin, ymax, dy)
+    lons, lats = grid["lon"].values, grid["lat"].values
+    lon, lat = np.meshgrid(lons, lats, indexing="ij")
+    coords = np.column_stack([lon.ravel(), lat.ravel()])
+    coords.flags.writeable = False
+    index = pd.MultiIndex.from_product([lons, lats], names=["lon", "lat"])
+    return coords, index
+
+
+_GRID_PROPERTIES = ("grid", "grid_coords", "grid_multiindex")
+
+#: Cached InversionConfig properties to drop when the field they derive from is
+#: reassigned, so configs mutated after construction never serve stale values.
+#: Only reassignment is seen, so new cached properties should derive from scalar
+#: fields; those reading list fields (e.g. subset_hours_utc) stay uncached.
+_DERIVED_PROPERTIES: dict[str, tuple[str, ...]] = {
+    **{
+        name: ("time_range", "flux_time_bins", "flux_times", "_flux_bin_edges")
+        for name in ("tstart", "tend")
+    },
+    "flux_freq": ("flux_time_bins", "flux_times", "_flux_bin_edges"),
+    **{
+        name: ("bbox", "extent", "map_extent", *_GRID_PROPERTIES)
+        for name in ("xmin", "xmax", "ymin", "ymax")
+    },
+    **{name: ("resolution", *_GRID_PROPERTIES) for name in ("dx", "dy")},
+    "mdm_config": ("mdm_components",),
+}
+
+
 @dataclass
 class InversionConfig:
     # --- Space & Time ---
@@ -239,6 +298,10 @@ class InversionConfig:
     plot_inputs: bool = True
     plot_results: bool = True
     plot_diagnostics: bool = False
+    # Directory to write figures to as PNGs instead of calling plt.show().
+    # With a non-interactive backend (e.g. Agg) and no directory, plotting is
+    # skipped in run() since nothing would be displayed.
+    save_figures: str | Path | None = None
 
     output_units: str = "Gg/m2/s"
 
@@ -247,15 +310,20 @@ class InversionConfig:
     )
     tiler_zoom: int = 10
 
-    @property
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        for attr in _DERIVED_PROPERTIES.get(name, ()):
+            self.__dict__.pop(attr, None)
+
+    @cached_property
     def bbox(self):
         return (self.xmin, self.ymin, self.xmax, self.ymax)
 
-    @property
+    @cached_property
     def extent(self):
         return (self.xmin, self.xmax, self.ymin, self.ymax)
 
-    @property
+    @cached_property
     def map_extent(self):
         # Add a buffer around the bbox for better visualization
         buffer = 0.05
@@ -266,53 +334,71 @@ class InversionConfig:
             self.ymax + buffer,
         )
 
-    @property
+    @cached_property
     def resolution(self) -> str:
         return f"{self.dx}x{self.dy}"
 
+    @property
+    def _grid_params(self) -> tuple[float, ...]:
+        return (self.xmin, self.xmax, self.dx, self.ymin, self.ymax, self.dy)
+
     @cached_property
     def grid(self):
-        # Create a regular grid with specified bounds and resolution
-        grid = generate_regular_grid(
-            xmin=self.xmin,
-            xmax=self.xmax,
-            dx=self.dx,
-            ymin=self.ymin,
-            ymax=self.ymax,
-            dy=self.dy,
-            x_label="lon",
-            y_label="lat",
-        )
-        grid = grid.rio.set_spatial_dims(x_dim="lon", y_dim="lat")
-        grid = write_rio_crs(grid, crs="EPSG:4326")
-        return grid
+        return _build_grid(*self._grid_params)
 
     @cached_property
-    def grid_coords(self):
-        return pd.MultiIndex.from_product(
-            [self.grid["lon"].values, self.grid["lat"].values]
-        ).to_list()
+    def grid_coords(self) -> np.ndarray:
+        """Grid cell centers as an ``(n_cells, 2)`` array of ``(lon, lat)`` rows.
 
-    @property
+        Rows follow the ``(lon, lat)`` product order (lat varies fastest), matching
+        ``grid_multiindex``. Shared across configs with the same grid; read-only.
+        """
+        return _build_grid_cells(*self._grid_params)[0]
+
+    @cached_property
+    def grid_multiindex(self) -> pd.MultiIndex:
+        """``(lon, lat)`` MultiIndex over the grid cells, for pandas consumers."""
+        return _build_grid_cells(*self._grid_params)[1]
+
+    @cached_property
     def time_range(self) -> tuple[pd.Timestamp, pd.Timestamp]:
         return (pd.Timestamp(self.tstart), pd.Timestamp(self.tend))
 
-    @property
+    @cached_property
     def flux_time_bins(self):
         """Generates time bins for flux estimation based on the time range and flux frequency."""
         t0, t1 = self.time_range
         return pd.interval_range(start=t0, end=t1, freq=self.flux_freq, closed="left")
 
-    @property
+    @cached_property
     def flux_times(self) -> pd.DatetimeIndex:
         """Returns the left edges of the flux time bins, which represent the time points for flux estimation."""
         return self.flux_time_bins.left
 
+    @cached_property
+    def _flux_bin_edges(self) -> np.ndarray:
+        """Edges of ``flux_time_bins`` as int64 nanoseconds (n_bins + 1 values)."""
+        bins = self.flux_time_bins
+        edges = bins.left.append(bins.right[-1:]) if len(bins) else bins.left
+        return edges.to_numpy(dtype="datetime64[ns]").view("i8")
+
+    def flux_bin_positions(self, times) -> np.ndarray:
+        """Position of each time in ``flux_time_bins`` (-1 if outside every bin)."""
+        t = pd.DatetimeIndex(times).to_numpy(dtype="datetime64[ns]").view("i8")
+        edges = self._flux_bin_edges
+        pos = np.searchsorted(edges, t, side="right") - 1
+        pos[pos >= len(edges) - 1] = -1
+        return pos
+
     @property
     def subset_hours_utc(self) -> list[float]:
-        """Dynamically converts local afternoon hours to UTC for data subsetting."""
+        """Local ``subset_hours`` converted to UTC for data subsetting.
+
+        Not cached: ``subset_hours`` is a list that may be edited in place, and
+        the conversion is a handful of additions.
+        """
         return [(hour - self.utc_offset) % 24 for hour in self.subset_hours]
 
-    @cached_property
+    @property
     def site_config(self):
-        return load_site_config()
+        return load_site_config()  # cached at module level
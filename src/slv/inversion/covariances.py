@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from fips.covariance import (
     BlockDecayError,
@@ -12,6 +13,25 @@ from fips.kernels import (
     RaggedTimeDecay,
 )
 
+#: Meteorological season for each month number (index 0 unused).
+_MONTH_TO_SEASON = np.array(
+    [
+        "",
+        "DJF",
+        "DJF",
+        "MAM",
+        "MAM",
+        "MAM",
+        "JJA",
+        "JJA",
+        "JJA",
+        "SON",
+        "SON",
+        "SON",
+        "DJF",
+    ]
+)
+
 
 def build_prior_error(prior, **kwargs) -> pd.DataFrame:
     """
@@ -90,38 +110,24 @@ def build_mdm_error(
         is_nested = isinstance(first_value, dict)
 
         if is_nested:
-            # Site/season-specific std
-            seasons = (
-                times.to_series()
-                .dt.month.map(
-                    {
-                        12: "DJF",
-                        1: "DJF",
-                        2: "DJF",
-                        3: "MAM",
-                        4: "MAM",
-                        5: "MAM",
-                        6: "JJA",
-                        7: "JJA",
-                        8: "JJA",
-                        9: "SON",
-                        10: "SON",
-                        11: "SON",
-                    }
-                )
-                .values
+            # Site/season-specific std: one indexer lookup into a flat
+            # (site, season) table instead of a dict lookup per observation
+            table = pd.Series(
+                {
+                    (site, season): val
+                    for site, by_season in std.items()
+                    for season, val in by_season.items()
+                }
             )
-
-            # Look up std for each observation by site and season
-            std_values = []
-            for loc, season in zip(locations, seasons, strict=False):
-                try:
-                    std_val = std[loc][season]
-                    std_values.append(std_val)
-                except (KeyError, TypeError):
-                    raise ValueError(
-                        f"No std value found for site='{loc}', season='{season}' in component '{name}'"
-                    )
+            seasons = _MONTH_TO_SEASON[times.month]
+            keys = pd.MultiIndex.from_arrays([locations, seasons])
+            idx = table.index.get_indexer(keys)
+            if (idx == -1).any():
+                loc, season = keys[np.argmax(idx == -1)]
+                raise ValueError(
+                    f"No std value found for site='{loc}', season='{season}' in component '{name}'"
+                )
+            std_values = table.to_numpy()[idx]
         else:
             # Organization-specific std (flat dict)
             if site_config is None:
@@ -130,16 +136,20 @@ def build_mdm_error(
                 )
 
             # Look up std for each observation by organization
-            std_values = []
-            for loc in locations:
-                org = site_config.at[loc, "organization"]
-                try:
-                    std_val = std[org]
-                    std_values.append(std_val)
-                except KeyError:
-                    raise ValueError(
-                        f"No std value found for organization='{org}' (site='{loc}') in component '{name}'"
-                    )
+            orgs = site_config["organization"]
+            orgs = orgs[~orgs.index.duplicated()]
+            unknown = ~locations.isin(orgs.index)
+            if unknown.any():
+                # Site missing from site_config: KeyError, as a .at lookup raises
+                raise KeyError(locations[np.argmax(unknown)])
+            orgs = orgs.reindex(locations)
+            missing = ~orgs.isin(list(std)).to_numpy()
+            if missing.any():
+                i = np.argmax(missing)
+                raise ValueError(
+                    f"No std value found for organization='{orgs.iloc[i]}' (site='{locations[i]}') in component '{name}'"
+                )
+            std_values = orgs.map(std).to_numpy()
 
         variances = pd.Series(std_values, index=obs_index) ** 2
     else:
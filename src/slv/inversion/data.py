@@ -25,9 +25,11 @@ def _drop_spike_days(obs: pd.DataFrame, percentile: float) -> pd.DataFrame:
             "day": t.dt.floor("D").to_numpy(),
         }
     )
-    hour_std = g.groupby(["site", "day", "hour"])["ch4"].std()
-    daily_spike = hour_std.groupby(level=["site", "day"]).mean()
-    thr = daily_spike.groupby(level="site").transform(lambda s: s.quantile(percentile))
+    hour_std = g.groupby(["site", "day", "hour"], sort=False)["ch4"].std()
+    daily_spike = hour_std.groupby(level=["site", "day"], sort=False).mean()
+    thr = daily_spike.groupby(level="site", sort=False).transform(
+        "quantile", percentile
+    )
     flagged = daily_spike.index[daily_spike > thr]
     if len(flagged) == 0:
         return obs
@@ -77,18 +79,20 @@ def get_slv_observations(
     # Build obs_location: site name for stationary, location_id for mobile.
     # Mobile location_ids use the snapped TRAX route point coordinates, which
     # already have 5dp precision from load_trax_points() and integer zagl.
+    obs_location = obs["site"].to_numpy(dtype=object, copy=True)
     if "is_mobile" in obs.columns:
-        mobile = obs["is_mobile"].astype(bool)
-        obs["obs_location"] = obs["site"]
-        obs.loc[mobile, "obs_location"] = (
+        mobile = obs["is_mobile"].astype(bool).to_numpy()
+        obs_location[mobile] = (
             obs.loc[mobile, "longitude"].round(5).astype(str)
             + "_"
             + obs.loc[mobile, "latitude"].round(5).astype(str)
             + "_"
             + obs.loc[mobile, "height"].round(0).astype(int).astype(str)
-        )
-    else:
-        obs["obs_location"] = obs["site"]
+        ).to_numpy()
 
-    obs = obs.rename(columns={"Time_UTC": "obs_time"})
-    return obs.set_index(["obs_location", "obs_time"])["CH4"].to_frame()
+    # Build the (obs_location, obs_time) index directly rather than renaming,
+    # re-indexing and slicing the whole aggregated frame
+    index = pd.MultiIndex.from_arrays(
+        [obs_location, obs["Time_UTC"].to_numpy()], names=["obs_location", "obs_time"]
+    )
+    return pd.DataFrame({"CH4": obs["CH4"].to_numpy()}, index=index)
@@ -0,0 +1,38 @@
+"""Process-level memoization for builders whose arguments are not hashable."""
+
+import functools
+import threading
+from collections import OrderedDict
+
+
+def keyed_lru_cache(maxsize: int, key):
+    """LRU-memoize a function on ``key(*args, **kwargs)``.
+
+    Like ``functools.lru_cache``, but for functions that take DataFrames or
+    DataArrays: *key* maps the call's arguments to a hashable cache key, so
+    only the parts that determine the result need to be hashed. Safe to call
+    from worker threads; ``cache_clear()`` empties the cache.
+    """
+
+    def decorator(func):
+        cache: OrderedDict = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            k = key(*args, **kwargs)
+            with lock:
+                if k in cache:
+                    cache.move_to_end(k)
+                    return cache[k]
+            result = func(*args, **kwargs)
+            with lock:
+                cache[k] = result
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return result
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
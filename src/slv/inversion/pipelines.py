@@ -1,30 +1,39 @@
+import contextlib
 import functools
 import hashlib
 import importlib
 import json
+import re
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as _dist_version
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from fips import Block, CovarianceMatrix, ForwardOperator, MatrixBlock, Vector
 from fips.aggregators import ObsAggregator
-from fips.covariance import CovarianceBuilder, DiagonalError
 from fips.problems.flux import FluxInversionPipeline, JacobianBuilder
 from fips.problems.flux.problem import FluxProblem
-from lair import inventories
+from joblib import Parallel, delayed
 
-from slv.inversion import viz
 from slv.inversion.background import get_slv_background
 from slv.inversion.covariances import build_mdm_error, build_prior_error
 from slv.inversion.data import get_slv_observations
 from slv.inversion.priors import get_slv_prior
 
+if TYPE_CHECKING:
+    from lair import inventories
+
+# Matplotlib backends that render to files only; plt.show() displays nothing.
+_NON_INTERACTIVE_BACKENDS: frozenset[str] = frozenset(
+    {"agg", "cairo", "pdf", "pgf", "ps", "svg", "template"}
+)
+
 # ---------------------------------------------------------------------------
 # Component dependency sets: maps each cache component to the InversionConfig fields
 # that actually affect that component's output.  Used to compute content-addressed
@@ -120,6 +129,21 @@ def _component_hash(config, fields: frozenset[str]) -> str:
     return hashlib.sha256(serialized.encode()).hexdigest()[:12]
 
 
+def _bias_error_block(bias_index: pd.Index, bias_std: float) -> MatrixBlock:
+    """Return the diagonal ``bias_std**2 * I`` prior-error block for the bias states.
+
+    Built directly rather than through ``DiagonalError`` since there is no
+    kernel to evaluate. Kept dense: a sparse block would make the assembled
+    prior error (and its dense flux block) sparse as well.
+    """
+    variances = np.full(len(bias_index), float(bias_std) ** 2)
+    return MatrixBlock(
+        pd.DataFrame(np.diag(variances), index=bias_index, columns=bias_index),
+        "bias",
+        "bias",
+    )
+
+
 def _pkg_rev(import_name: str, dist_name: str) -> str:
     """Source revision of a package, for cache keying.
 
@@ -178,6 +202,16 @@ def _version_tag() -> str:
     return f"fips-{_pkg_rev('fips', 'fips')}_pystilt-{_pkg_rev('stilt', 'pystilt')}"
 
 
+_CACHE_LOCKS: dict[Path, threading.Lock] = {}
+_CACHE_LOCKS_GUARD = threading.Lock()
+
+
+def _cache_lock(path: Path) -> threading.Lock:
+    """Return the process-wide lock guarding cache file *path*."""
+    with _CACHE_LOCKS_GUARD:
+        return _CACHE_LOCKS.setdefault(path, threading.Lock())
+
+
 def fips_cache(cls, filename):
     """Content-addressed cache decorator for pipeline methods.
 
@@ -251,29 +285,32 @@ def fips_cache(cls, filename):
                 component_dir = fips_dir
                 path = fips_dir / f"{filename}.pkl"
 
-            if path.exists() and not should_overwrite:
-                print(
-                    f"Loading cached {filename} [{h if fields else 'flat'}] from {path}"
-                )
-                return cls.from_file(path)
-
-            if should_overwrite and fields and component_dir.exists():
-                # Remove all stale hashes for this component before recomputing
-                stale = list(component_dir.glob("*.pkl"))
-                for s in stale:
-                    s.unlink()
-                if stale:
+            # Components may be built concurrently (see get_inputs); serialize
+            # the check/compute/save per cache file so a path is written once.
+            with _cache_lock(path):
+                if path.exists() and not should_overwrite:
                     print(
-                        f"Cleared {len(stale)} stale cache file(s) for component '{filename}'"
+                        f"Loading cached {filename} [{h if fields else 'flat'}] from {path}"
                     )
+                    return cls.from_file(path)
+
+                if should_overwrite and fields and component_dir.exists():
+                    # Remove all stale hashes for this component before recomputing
+                    stale = list(component_dir.glob("*.pkl"))
+                    for s in stale:
+                        s.unlink()
+                    if stale:
+                        print(
+                            f"Cleared {len(stale)} stale cache file(s) for component '{filename}'"
+                        )
 
-            result = method(self, *args, **kwargs)
+                result = method(self, *args, **kwargs)
 
-            component_dir.mkdir(parents=True, exist_ok=True)
-            print(f"Saving {filename} [{h if fields else 'flat'}] to {path}")
-            result.to_file(path)
+                component_dir.mkdir(parents=True, exist_ok=True)
+                print(f"Saving {filename} [{h if fields else 'flat'}] to {path}")
+                result.to_file(path)
 
-            return result
+                return result
 
         return wrapper
 
@@ -292,12 +329,18 @@ class SLVMethaneInversion(FluxInversionPipeline):
     COMPONENT_DEPS: dict[str, frozenset[str]] = {
         **DEFAULT_COMPONENT_DEPS,
         "prior": DEFAULT_COMPONENT_DEPS["prior"] | {"bias_std", "bias_grouping"},
-        "forward_operator": DEFAULT_COMPONENT_DEPS["forward_operator"]
-        | {"bias_std", "bias_grouping"},
+        # "forward_operator" caches only the flux Jacobian (the bias block is
+        # assembled outside the cache), so it keeps the bias-free default deps.
         "prior_error": DEFAULT_COMPONENT_DEPS["prior_error"]
         | {"bias_std", "bias_grouping"},
     }
 
+    def __init__(self, config):
+        super().__init__(config)
+        #: Elapsed seconds per pipeline stage, filled in by ``_stage``.
+        self.timings: dict[str, float] = {}
+        self._timings_lock = threading.Lock()
+
     @fips_cache(Vector, "obs")
     def get_obs(self) -> Vector:
         """Passes just the obs attributes to the pure obs function."""
@@ -341,13 +384,30 @@ class SLVMethaneInversion(FluxInversionPipeline):
         bias_blk = Block(self.get_bias(), name="bias")
         return Vector(name="prior", data=[flux_prior.blocks["flux"], bias_blk])
 
-    @fips_cache(ForwardOperator, "forward_operator")
     def get_forward_operator(self, obs: Vector, prior: Vector) -> ForwardOperator:
         """Get the forward operator, optionally including bias Jacobian.
 
         Returns a single-block flux Jacobian if bias_std is None, otherwise
-        returns a multi-block [flux_jac | bias_jac] operator.
+        returns a multi-block [flux_jac | bias_jac] operator. Only the (expensive)
+        flux Jacobian is cached, so toggling the bias settings reuses it; the
+        bias block is a cheap one-hot map rebuilt each call.
         """
+        flux_operator = self.get_flux_forward_operator(obs)
+
+        # Return flux-only operator if no bias
+        if self.config.bias_std is None:
+            return flux_operator
+
+        # Add bias Jacobian
+        flux_jac_blk = flux_operator.blocks["concentration", "flux"]
+        bias_jac_blk = MatrixBlock(
+            self.get_bias_jacobian(obs, prior), "concentration", "bias"
+        )
+        return ForwardOperator([flux_jac_blk, bias_jac_blk])
+
+    @fips_cache(ForwardOperator, "forward_operator")
+    def get_flux_forward_operator(self, obs: Vector) -> ForwardOperator:
+        """Build the flux-only forward operator from the STILT footprints."""
         from stilt import Model, SimID
 
         from slv.inversion.config import build_location_site_map
@@ -358,11 +418,12 @@ class SLVMethaneInversion(FluxInversionPipeline):
         # Must happen before filtering so stationary sites can be resolved.
         # Mobile location_ids won't appear in the mapper (no site_config entry),
         # so mapper.get(lid, lid) returns the location_id itself for mobile sims.
+        # Parse every simulation ID once; both the mapper and the filter need it.
+        all_location_ids = {SimID(sid).location for sid in model.simulations}
         location_mapper = self.config.location_site_map
         if not location_mapper:
-            all_location_ids = list({SimID(sid).location for sid in model.simulations})
             location_mapper = build_location_site_map(
-                all_location_ids, self.config.site_config
+                list(all_location_ids), self.config.site_config
             )
             print(f"Auto-generated location mapper for {len(location_mapper)} sites")
             self.config.location_site_map = location_mapper
@@ -374,7 +435,7 @@ class SLVMethaneInversion(FluxInversionPipeline):
         obs_locations = set(obs.index.get_level_values("obs_location"))
         relevant_location_ids = {
             lid
-            for lid in {SimID(sid).location for sid in model.simulations}
+            for lid in all_location_ids
             if location_mapper.get(lid, lid) in obs_locations
         }
 
@@ -403,17 +464,7 @@ class SLVMethaneInversion(FluxInversionPipeline):
             timeout=self.config.timeout,
             sparse=self.config.sparse_jacobian,
         )
-
-        # Return flux-only operator if no bias
-        if self.config.bias_std is None:
-            return ForwardOperator(jacobian)
-
-        # Add bias Jacobian
-        flux_jac_blk = ForwardOperator(jacobian).blocks["concentration", "flux"]
-        bias_jac_blk = MatrixBlock(
-            self.get_bias_jacobian(obs, prior), "concentration", "bias"
-        )
-        return ForwardOperator([flux_jac_blk, bias_jac_blk])
+        return ForwardOperator(jacobian)
 
     @fips_cache(CovarianceMatrix, "prior_error")
     def get_prior_error(self, prior: Vector) -> CovarianceMatrix:
@@ -442,11 +493,7 @@ class SLVMethaneInversion(FluxInversionPipeline):
         flux_err_blk = CovarianceMatrix(name="prior_error", data=S_0).blocks[
             "flux", "flux"
         ]
-        bias_index = prior["bias"].index
-        bias_err = DiagonalError(
-            name="bias_error", variances=self.config.bias_std**2
-        ).build(bias_index)
-        bias_err_blk = MatrixBlock(bias_err, "bias", "bias")
+        bias_err_blk = _bias_error_block(prior["bias"].index, self.config.bias_std)
 
         return CovarianceMatrix(name="prior_error", data=[flux_err_blk, bias_err_blk])
 
@@ -459,18 +506,26 @@ class SLVMethaneInversion(FluxInversionPipeline):
             for comp in self.config.mdm_components
         ]
 
-        if self.config.plot_diagnostics:
-            built_comps = {comp.name: comp.build(obs.index) for comp in components}
-            viz.plot_mdm_components(built_comps)
-            return CovarianceMatrix(
-                name="modeldata_mismatch",
-                data=np.add.reduce([comp.to_numpy() for comp in built_comps.values()]),
-                index=obs.index,
+        # Components are independent dense builds whose NumPy kernels release the
+        # GIL, so build them on threads and sum (as CovarianceBuilder.build does)
+        n_jobs = min(self.config.num_processes, len(components))
+        if n_jobs > 1:
+            built = Parallel(n_jobs=n_jobs, backend="threading")(
+                delayed(comp.build)(obs.index) for comp in components
             )
+        else:
+            built = [comp.build(obs.index) for comp in components]
 
+        if self.config.plot_diagnostics:
+            # Plotted by plot_diagnostics; this may run on a get_inputs worker
+            # thread, where figures must not be created
+            self._mdm_components = {
+                comp.name: b for comp, b in zip(components, built, strict=True)
+            }
         return CovarianceMatrix(
             name="modeldata_mismatch",
-            data=CovarianceBuilder(components).build(obs.index),
+            data=np.add.reduce([b.to_numpy(dtype=float) for b in built]),
+            index=obs.index,
         )
 
     @fips_cache(Vector, "constant")
@@ -487,11 +542,19 @@ class SLVMethaneInversion(FluxInversionPipeline):
             **self.config.background_kwargs,
         )
 
-        # Align background to obs index
-        data = (
-            obs.data.reset_index()
-            .join(data, on="obs_time", lsuffix="_obs")
-            .set_index(["obs_location", "obs_time"])["concentration"]
+        # Align background to obs index: one positional lookup per obs time,
+        # then a single gather (-1 = no background for that time -> NaN)
+        obs_index = obs.data.index
+        obs_time = obs_index.get_level_values("obs_time")
+        pos = data.index.get_indexer(obs_time)
+        values = np.append(data.to_numpy(dtype=float), np.nan)[pos]
+        data = pd.Series(
+            values,
+            index=pd.MultiIndex.from_arrays(
+                [obs_index.get_level_values("obs_location"), obs_time],
+                names=["obs_location", "obs_time"],
+            ),
+            name="concentration",
         )
 
         # Drop obs whose background is missing (e.g. days outside the ct_stilt
@@ -565,8 +628,10 @@ class SLVMethaneInversion(FluxInversionPipeline):
             )
         return obs, forward_operator, modeldata_mismatch, constant
 
-    def fluxes_as_inventory(self, fluxes: pd.Series) -> inventories.Inventory:
+    def fluxes_as_inventory(self, fluxes: pd.Series) -> "inventories.Inventory":
         """Converts a flux vector to an inventory format for easier analysis."""
+        from lair import inventories
+
         ds = fluxes.to_xarray().to_dataset()
 
         time_step = {
@@ -581,15 +646,42 @@ class SLVMethaneInversion(FluxInversionPipeline):
             ds, pollutant="CH4", src_units="umol/m2/s", time_step=time_step
         )
 
-    def calculate_total_flux(self, fluxes: pd.Series, units=None) -> pd.Series:
-        inventory = self.fluxes_as_inventory(fluxes)
+    def _flux_total_weights(self, index: pd.MultiIndex, units=None) -> np.ndarray:
+        """Per-entry factors turning fluxes on ``index`` into absolute emissions.
+
+        Unit conversion and area/time integration are linear, so the factors are
+        taken once from an all-ones inventory and reused for every flux vector on
+        the same index (prior, posterior, reconstructed) and output units.
+        """
+        cache = getattr(self, "_flux_weight_cache", None)
+        if cache is None:
+            cache = self._flux_weight_cache = {}
+        cached = cache.get(units)
+        if cached is not None and cached[0].equals(index):
+            return cached[1]
+
+        ones = pd.Series(1.0, index=index, name="flux")
+        inventory = self.fluxes_as_inventory(ones)
         if units:
             inventory = inventory.convert_units(units)
-        return (
-            inventory.absolute_emissions[fluxes.name]
-            .sum(dim=("lat", "lon"))
+        weights = (
+            inventory.absolute_emissions["flux"]
             .to_series()
+            .reorder_levels(index.names)
+            .reindex(index)
+            .to_numpy(dtype=float)
         )
+        cache[units] = (index, weights)
+        return weights
+
+    def calculate_total_flux(self, fluxes: pd.Series, units=None) -> pd.Series:
+        weights = self._flux_total_weights(fluxes.index, units)
+        emissions = pd.Series(
+            fluxes.to_numpy(dtype=float) * weights, index=fluxes.index
+        )
+        total = emissions.groupby(level="time").sum()
+        total.name = fluxes.name
+        return total
 
     def desroziers_diagnostic(
         self,
@@ -708,133 +800,183 @@ class SLVMethaneInversion(FluxInversionPipeline):
             return None
         return self._all_cells - self._removed_cells
 
-    def plot_inputs(self, problem: FluxProblem):
-        config = self.config
+    def _plotting_enabled(self, flag: bool) -> bool:
+        """Return whether a ``plot_*`` stage of ``run`` should execute.
 
-        # --- Plot Grid ---
-        viz.plot_grid(
-            config.grid,
-            extent=config.map_extent,
-            tiler=config.tiler,
-            zoom=config.tiler_zoom,
-            sites=config.sites,
-            site_config=config.site_config,
-        )
+        Figures (and their map tile fetches) are skipped when the matplotlib
+        backend is non-interactive and ``config.save_figures`` is unset, since
+        they would never be shown.
+        """
+        if not flag:
+            return False
+        if self.config.save_figures is not None:
+            return True
+        import matplotlib
+
+        return matplotlib.get_backend().lower() not in _NON_INTERACTIVE_BACKENDS
+
+    @contextlib.contextmanager
+    def _figures(self, prefix: str):
+        """Collect the figures created in the block, then show or save them.
+
+        With ``config.save_figures`` unset the figures are shown. Otherwise
+        each new figure is saved to that directory as
+        ``{prefix}_{label or number}.png`` and closed; figures that were
+        already open before the block are left alone.
+        """
+        import matplotlib.pyplot as plt
+
+        before = set(plt.get_fignums())
+        yield
+        if self.config.save_figures is None:
+            plt.show()
+            return
+
+        out_dir = Path(self.config.save_figures)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for num in plt.get_fignums():
+            if num in before:
+                continue
+            fig = plt.figure(num)
+            name = re.sub(r"[^\w.-]+", "_", fig.get_label()) or str(num)
+            fig.savefig(out_dir / f"{prefix}_{name}.png", dpi=150, bbox_inches="tight")
+            plt.close(fig)
 
-        # --- Plot Concentrations ---
-        viz.plot_concentrations(problem.concentrations)
+    def plot_inputs(self, problem: FluxProblem):
+        from slv.inversion import viz
 
-        # --- Plot Prior Fluxes ---
-        if self._retained_cells is not None:
-            full_prior_xr = self._full_prior["flux"].to_xarray()
-            viz.plot_prior_with_coverage(
-                full_prior_xr,
-                self._retained_cells,
-                self._all_cells,
-                dx=config.dx,
-                dy=config.dy,
-                extent=config.map_extent,
-                tiler=config.tiler,
-                zoom=config.tiler_zoom,
-            )
-        else:
-            viz.plot_inventory(
-                problem.prior_fluxes.to_xarray(),
+        config = self.config
+
+        with self._figures("inputs"):
+            # --- Plot Grid ---
+            viz.plot_grid(
+                config.grid,
                 extent=config.map_extent,
                 tiler=config.tiler,
                 zoom=config.tiler_zoom,
+                sites=config.sites,
+                site_config=config.site_config,
             )
 
-        plt.show()
+            # --- Plot Concentrations ---
+            viz.plot_concentrations(problem.concentrations)
+
+            # --- Plot Prior Fluxes ---
+            if self._retained_cells is not None:
+                full_prior_xr = self._full_prior["flux"].to_xarray()
+                viz.plot_prior_with_coverage(
+                    full_prior_xr,
+                    self._retained_cells,
+                    self._all_cells,
+                    dx=config.dx,
+                    dy=config.dy,
+                    extent=config.map_extent,
+                    tiler=config.tiler,
+                    zoom=config.tiler_zoom,
+                )
+            else:
+                viz.plot_inventory(
+                    problem.prior_fluxes.to_xarray(),
+                    extent=config.map_extent,
+                    tiler=config.tiler,
+                    zoom=config.tiler_zoom,
+                )
 
     def plot_results(self, problem: FluxProblem):
-        config = self.config
+        from slv.inversion import viz
 
-        # --- Plot Fluxes (inversion domain only) ---
-        viz.plot_fluxes(
-            problem,
-            tiler=config.tiler,
-            zoom=config.tiler_zoom,
-            add_sites=True,
-            sites=config.sites,
-            site_config=config.site_config,
-        )
+        config = self.config
 
-        # --- Plot Reconstructed Posterior (full domain) ---
-        if self._retained_cells is not None:
-            reconstructed = self.reconstruct_posterior()
-            reconstructed_xr = reconstructed.to_xarray()
-            viz.plot_reconstructed_posterior(
-                reconstructed_xr,
-                self._retained_cells,
-                self._all_cells,
-                dx=config.dx,
-                dy=config.dy,
-                extent=config.map_extent,
+        with self._figures("results"):
+            # --- Plot Fluxes (inversion domain only) ---
+            viz.plot_fluxes(
+                problem,
                 tiler=config.tiler,
                 zoom=config.tiler_zoom,
+                add_sites=True,
                 sites=config.sites,
                 site_config=config.site_config,
             )
 
-        # --- Total Emissions (use full reconstructed domain) ---
-        if self._retained_cells is not None:
-            full_prior = self._full_prior["flux"]
-            full_prior.name = problem.prior_fluxes.name
-            total_prior = self.calculate_total_flux(
-                full_prior, units=config.output_units
-            )
-            total_posterior = self.calculate_total_flux(
-                reconstructed, units=config.output_units
-            )
-        else:
-            total_prior = self.calculate_total_flux(
-                problem.prior_fluxes, units=config.output_units
-            )
-            total_posterior = self.calculate_total_flux(
-                problem.posterior_fluxes, units=config.output_units
-            )
-        viz.plot_total_fluxes_over_time(total_prior, total_posterior)
+            # --- Plot Reconstructed Posterior (full domain) ---
+            if self._retained_cells is not None:
+                reconstructed = self.reconstruct_posterior()
+                reconstructed_xr = reconstructed.to_xarray()
+                viz.plot_reconstructed_posterior(
+                    reconstructed_xr,
+                    self._retained_cells,
+                    self._all_cells,
+                    dx=config.dx,
+                    dy=config.dy,
+                    extent=config.map_extent,
+                    tiler=config.tiler,
+                    zoom=config.tiler_zoom,
+                    sites=config.sites,
+                    site_config=config.site_config,
+                )
 
-        # --- Plot Concentrations ---
-        problem.plot.concentrations()
+            # --- Total Emissions (use full reconstructed domain) ---
+            if self._retained_cells is not None:
+                full_prior = self._full_prior["flux"]
+                full_prior.name = problem.prior_fluxes.name
+                total_prior = self.calculate_total_flux(
+                    full_prior, units=config.output_units
+                )
+                total_posterior = self.calculate_total_flux(
+                    reconstructed, units=config.output_units
+                )
+            else:
+                total_prior = self.calculate_total_flux(
+                    problem.prior_fluxes, units=config.output_units
+                )
+                total_posterior = self.calculate_total_flux(
+                    problem.posterior_fluxes, units=config.output_units
+                )
+            viz.plot_total_fluxes_over_time(total_prior, total_posterior)
 
-        # --- Plot Residuals ---
-        viz.plot_residuals(problem)
+            # --- Plot Concentrations ---
+            problem.plot.concentrations()
 
-        # --- Plot Background and Bias ---
-        viz.plot_background_and_bias(problem)
+            # --- Plot Residuals ---
+            viz.plot_residuals(problem)
 
-        plt.show()
+            # --- Plot Background and Bias ---
+            viz.plot_background_and_bias(problem)
 
     def plot_diagnostics(self, problem: FluxProblem):
+        from slv.inversion import viz
+
         config = self.config
-        # --- Plot Fluxes by Timestep ---
-        viz.plot_fluxes_by_timestep(
-            problem,
-            extent=config.map_extent,
-            tiler=config.tiler,
-            zoom=config.tiler_zoom,
-            add_sites=True,
-            sites=config.sites,
-            site_config=config.site_config,
-        )
 
-        # --- Plot Desroziers Diagnostic ---
-        viz.plot_desroziers(
-            by_site=self.desroziers_diagnostic(),
-            per_obs=self.desroziers_diagnostic(groupby=None),
-            timeseries=self.desroziers_diagnostic(freq=config.flux_freq),
-        )
+        with self._figures("diagnostics"):
+            # --- Plot Fluxes by Timestep ---
+            viz.plot_fluxes_by_timestep(
+                problem,
+                extent=config.map_extent,
+                tiler=config.tiler,
+                zoom=config.tiler_zoom,
+                add_sites=True,
+                sites=config.sites,
+                site_config=config.site_config,
+            )
 
-        # --- Plot Unconstrained Cells Contribution ---
-        if hasattr(self, "_removed_contribution"):
-            viz.plot_removed_contribution(
-                self._removed_contribution,
-                problem.constant["concentration"],
+            # --- Plot Desroziers Diagnostic ---
+            viz.plot_desroziers(
+                by_site=self.desroziers_diagnostic(),
+                per_obs=self.desroziers_diagnostic(groupby=None),
+                timeseries=self.desroziers_diagnostic(freq=config.flux_freq),
             )
 
-        plt.show()
+            # --- Plot MDM Components ---
+            if hasattr(self, "_mdm_components"):
+                viz.plot_mdm_components(self._mdm_components)
+
+            # --- Plot Unconstrained Cells Contribution ---
+            if hasattr(self, "_removed_contribution"):
+                viz.plot_removed_contribution(
+                    self._removed_contribution,
+                    problem.constant["concentration"],
+                )
 
     def _apply_jacobian_coverage_filter(self, inputs: dict[str, Any]) -> dict[str, Any]:
         """Remove cells with insufficient Jacobian coverage from the state vector.
@@ -965,11 +1107,9 @@ class SLVMethaneInversion(FluxInversionPipeline):
             flux_err_blk = CovarianceMatrix(name="prior_error", data=S_0).blocks[
                 "flux", "flux"
             ]
-            bias_index = filtered_prior["bias"].index
-            bias_err = DiagonalError(
-                name="bias_error", variances=self.config.bias_std**2
-            ).build(bias_index)
-            bias_err_blk = MatrixBlock(bias_err, "bias", "bias")
+            bias_err_blk = _bias_error_block(
+                filtered_prior["bias"].index, self.config.bias_std
+            )
             prior_error = CovarianceMatrix(
                 name="prior_error", data=[flux_err_blk, bias_err_blk]
             )
@@ -1015,60 +1155,160 @@ class SLVMethaneInversion(FluxInversionPipeline):
 
         return full_posterior
 
+    @contextlib.contextmanager
+    def _stage(self, name: str, done: str, start: str | None = None):
+        """Time a pipeline stage: print *start*, then "*done* in Xs".
+
+        Elapsed seconds are also recorded in ``self.timings[name]`` so runs can
+        be profiled programmatically. Safe to use from worker threads.
+        """
+        if start:
+            print(start)
+        t0 = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - t0
+        with self._timings_lock:
+            self.timings[name] = elapsed
+        print(f"{done} in {elapsed:.2f}s")
+
+    def _staged(self, name: str, done: str, func, **kwargs):
+        """Call ``func(**kwargs)`` inside ``self._stage(name, done)``."""
+        with self._stage(name, done):
+            return func(**kwargs)
+
+    def get_inputs(self) -> dict[str, Any]:
+        """Gather the inverse-problem inputs, building independent ones concurrently.
+
+        Same steps as ``FluxInversionPipeline.get_inputs``, scheduled by data
+        dependency on up to ``config.num_processes`` threads (the builders are
+        I/O bound or spend their time in GIL-releasing NumPy kernels):
+
+        1. ``obs`` and ``prior``;
+        2. ``constant`` as soon as ``obs`` is ready, then state-space filtering;
+        3. forward operator, prior error and model-data mismatch;
+        4. obs-space aggregation.
+
+        Each step is timed into ``self.timings``.
+        """
+        staged = self._staged
+        n_workers = max(1, min(self.config.num_processes, 3))
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            print("Loading observations and prior...")
+            obs_future = executor.submit(
+                staged, "obs", "Observations loaded", self.get_obs
+            )
+            prior_future = executor.submit(
+                staged, "prior", "Prior loaded", self.get_prior
+            )
+
+            obs = obs_future.result()
+            constant_future = executor.submit(
+                staged, "constant", "Constant term loaded", self.get_constant, obs=obs
+            )
+            prior = prior_future.result()
+
+            obs, prior = staged(
+                "filter_state_space",
+                "Optionally, state space filtered",
+                self.filter_state_space,
+                obs=obs,
+                prior=prior,
+            )
+
+            print("Building forward operator and covariances...")
+            fo_future = executor.submit(
+                staged,
+                "forward_operator",
+                "Forward operator built",
+                self.get_forward_operator,
+                obs=obs,
+                prior=prior,
+            )
+            prior_error_future = executor.submit(
+                staged,
+                "prior_error",
+                "Prior error covariance built",
+                self.get_prior_error,
+                prior=prior,
+            )
+            mdm_future = executor.submit(
+                staged,
+                "modeldata_mismatch",
+                "Model-data mismatch covariance built",
+                self.get_modeldata_mismatch,
+                obs=obs,
+            )
+            constant = constant_future.result()
+            forward_operator = fo_future.result()
+            prior_error = prior_error_future.result()
+            mdm = mdm_future.result()
+
+        obs, forward_operator, mdm, constant = staged(
+            "aggregate_obs_space",
+            "Optionally, observation space aggregated",
+            self.aggregate_obs_space,
+            obs=obs,
+            forward_operator=forward_operator,
+            modeldata_mismatch=mdm,
+            constant=constant,
+        )
+        return dict(
+            obs=obs,
+            prior=prior,
+            forward_operator=forward_operator,
+            prior_error=prior_error,
+            modeldata_mismatch=mdm,
+            constant=constant,
+        )
+
     def run(self, estimator_kwargs: dict | None = None, **kwargs) -> FluxProblem:
+        self.timings = {}
         total_start = time.perf_counter()
-        print("Getting problem inputs...")
-        inputs = self.get_inputs()
-        print(f"Inputs prepared in {time.perf_counter() - total_start:.2f}s")
+        with self._stage("inputs", "Inputs prepared", "Getting problem inputs..."):
+            inputs = self.get_inputs()
 
         # Apply Jacobian-based cell filtering
         if self.config.jacobian_coverage_percentile is not None:
-            step_start = time.perf_counter()
-            print("Filtering cells by Jacobian coverage...")
-            inputs = self._apply_jacobian_coverage_filter(inputs)
-            print(f"Cells filtered in {time.perf_counter() - step_start:.2f}s")
-
-        print("Initializing solver...")
-        step_start = time.perf_counter()
-        self.problem = self._InverseProblem(
-            **inputs,
-            **kwargs,
-        )
-        print(f"Solver initialized in {time.perf_counter() - step_start:.2f}s")
-
-        if self.config.plot_inputs:
-            step_start = time.perf_counter()
-            self.plot_inputs(self.problem)
-            print(f"Inputs plotted in {time.perf_counter() - step_start:.2f}s")
-
-        print("Solving...")
-        step_start = time.perf_counter()
-        # Build estimator kwargs: config gamma + explicit overrides
-        solve_kwargs = {}
-        if self.config.gamma is not None:
-            solve_kwargs["gamma"] = self.config.gamma
-        if estimator_kwargs:
-            solve_kwargs.update(estimator_kwargs)
-        self.problem.solve(estimator=self.estimator, **solve_kwargs)
-        print(f"Solve completed in {time.perf_counter() - step_start:.2f}s")
+            with self._stage(
+                "coverage_filter",
+                "Cells filtered",
+                "Filtering cells by Jacobian coverage...",
+            ):
+                inputs = self._apply_jacobian_coverage_filter(inputs)
+
+        with self._stage("init", "Solver initialized", "Initializing solver..."):
+            self.problem = self._InverseProblem(
+                **inputs,
+                **kwargs,
+            )
+
+        if self._plotting_enabled(self.config.plot_inputs):
+            with self._stage("plot_inputs", "Inputs plotted"):
+                self.plot_inputs(self.problem)
+
+        with self._stage("solve", "Solve completed", "Solving..."):
+            # Build estimator kwargs: config gamma + explicit overrides
+            solve_kwargs = {}
+            if self.config.gamma is not None:
+                solve_kwargs["gamma"] = self.config.gamma
+            if estimator_kwargs:
+                solve_kwargs.update(estimator_kwargs)
+            self.problem.solve(estimator=self.estimator, **solve_kwargs)
 
         # Print summary report
-        print("Calculating summary...")
-        step_start = time.perf_counter()
-        self.summarize()
-        print(f"Summary calculated in {time.perf_counter() - step_start:.2f}s")
+        with self._stage("summary", "Summary calculated", "Calculating summary..."):
+            self.summarize()
 
-        if self.config.plot_results:
-            step_start = time.perf_counter()
-            self.plot_results(self.problem)
-            print(f"Results plotted in {time.perf_counter() - step_start:.2f}s")
+        if self._plotting_enabled(self.config.plot_results):
+            with self._stage("plot_results", "Results plotted"):
+                self.plot_results(self.problem)
 
-        if self.config.plot_diagnostics:
-            step_start = time.perf_counter()
-            self.plot_diagnostics(self.problem)
-            print(f"Diagnostics plotted in {time.perf_counter() - step_start:.2f}s")
+        if self._plotting_enabled(self.config.plot_diagnostics):
+            with self._stage("plot_diagnostics", "Diagnostics plotted"):
+                self.plot_diagnostics(self.problem)
 
-        print(f"Total pipeline time: {time.perf_counter() - total_start:.2f}s")
+        self.timings["total"] = time.perf_counter() - total_start
+        print(f"Total pipeline time: {self.timings['total']:.2f}s")
 
         return self.problem
 
@@ -1131,15 +1371,17 @@ class SLVMethaneInversion(FluxInversionPipeline):
         obs_times = obs_index.get_level_values("obs_time")
         grouping = self.config.bias_grouping
 
-        # Bin obs times into flux intervals
-        cut = pd.cut(obs_times, bins=self.config.flux_time_bins)
-        flux_times = cut.map(lambda iv: iv.left if pd.notna(iv) else None)
+        # Bin obs times into flux intervals (-1 = outside every interval)
+        bin_pos = self.config.flux_bin_positions(obs_times)
+        in_bin = bin_pos >= 0
+        bin_times = self.config.flux_times
+        flux_times = bin_times.append(pd.DatetimeIndex([pd.NaT]))[bin_pos]
 
         if grouping in (None, "time"):
             # Time-only: simple one-hot encoding
-            jac = pd.get_dummies(cut, dtype=float)
-            jac.columns = jac.columns.map(lambda iv: iv.left)
-            jac.index = obs_index
+            onehot = np.zeros((len(obs_index), len(bin_times)))
+            onehot[np.flatnonzero(in_bin), bin_pos[in_bin]] = 1.0
+            jac = pd.DataFrame(onehot, index=obs_index, columns=bin_times)
 
         elif grouping == "site":
             # Per-site: match (time, obs_location)
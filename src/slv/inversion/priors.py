@@ -1,6 +1,13 @@
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
 import pandas as pd
 import xarray as xr
-from lair import inventories
+
+from slv.inversion.memo import keyed_lru_cache
 
 
 def get_slv_prior(
@@ -41,76 +48,156 @@ def build_constant_prior(out_grid, flux_times, value=0.0, units=None):
     value : float
         Constant flux value to fill the prior with (default 0.0).
     units : str, optional
-        Units string to attach as metadata.
+        Units string to attach as metadata (``Series.attrs["units"]``).
     """
-    grid_da = xr.DataArray(
-        data=value,
-        coords={"time": flux_times, "lon": out_grid["lon"], "lat": out_grid["lat"]},
-        dims=["time", "lon", "lat"],
-        name="flux",
-        attrs={"units": units} if units else {},
+    # Build the (time, lon, lat) Series directly; no need to broadcast a full
+    # DataArray just to flatten it again
+    index = pd.MultiIndex.from_product(
+        [pd.Index(flux_times), out_grid["lon"].values, out_grid["lat"].values],
+        names=["time", "lon", "lat"],
     )
-    return grid_da.to_series()
+    prior = pd.Series(value, index=index, name="flux")
+    if units:
+        prior.attrs["units"] = units
+    return prior
 
 
-def load_epa_prior(
-    out_grid,
-    flux_times,
-    flux_freq=None,
-    bbox=None,
-    extent=None,
-    units=None,
-    express=False,
-    return_regridder=False,
-):
-    if not express:
-        # Load inventories
-        annual = inventories.EPAv2()
-        monthly = inventories.EPAv2(scale_by_month=True)
+def _as_key(bounds):
+    """Hashable form of a bbox/extent argument."""
+    return None if bounds is None else tuple(float(b) for b in bounds)
 
-        # Clip to the bounding box or extent
-        if any([bbox, extent]):
-            annual = annual.clip(bbox=bbox, extent=extent)
-            monthly = monthly.clip(bbox=bbox, extent=extent)
 
-        # Convert units
-        if units:
-            annual = annual.convert_units(units)
-            monthly = monthly.convert_units(units)
+def _add_annual_total(monthly_total, annual_total):
+    """Add an annual sector total to a monthly one at monthly freq.
 
-        # Get annual only variables
-        annual_vars = set(annual.data.data_vars)
-        monthly_vars = set(monthly.data.data_vars)
-        annual_only_vars = annual_vars - monthly_vars
+    The annual total is forward-filled to the monthly times. The two are
+    aligned with an outer join and gaps (including months before the first
+    annual step) count as zero, matching a skipna sum over the merged sectors.
+    The monthly total's name and attrs are kept.
+    """
+    repeated = annual_total.reindex(time=monthly_total.time, method="ffill")
+    monthly, repeated = xr.align(monthly_total, repeated, join="outer", fill_value=0)
+    total = monthly + repeated.fillna(0)
+    return total.rename(monthly_total.name).assign_attrs(monthly_total.attrs)
 
-        # Repeat annual data to monthly freq
-        repeated_annual = annual.data[annual_only_vars].reindex(
-            time=monthly.data.time, method="ffill"
-        )
 
-        # Merge annual and monthly data
-        merged = xr.merge([repeated_annual, monthly.data])
+@lru_cache(maxsize=4)
+def _load_epa_total(bbox, extent, units, express):
+    """EPA inventory clipped, converted and summed over sectors.
 
-        # Sum sectors
-        total = inventories.sum_sectors(merged)
-    else:
-        express = inventories.EPAv2(express=True)  # dont scale by month
+    Memoized per (bbox, extent, units, express) so repeated priors in a process
+    skip the NetCDF reads; treat the returned dataset as read-only.
+    """
+    from lair import inventories  # scans the inventory archive; import on use
+
+    def prepare(**kwargs):
+        inventory = inventories.EPAv2(**kwargs)
 
         # Clip to the bounding box or extent
         if any([bbox, extent]):
-            express = express.clip(bbox=bbox, extent=extent)
+            inventory = inventory.clip(bbox=bbox, extent=extent)
 
         # Convert units
         if units:
-            express = express.convert_units(units)
+            inventory = inventory.convert_units(units)
+        return inventory
+
+    if not express:
+        # Load inventories; the annual and month-scaled reads are independent
+        # and I/O bound, so overlap them
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            annual_future = executor.submit(prepare)
+            monthly_future = executor.submit(prepare, scale_by_month=True)
+            annual, monthly = annual_future.result(), monthly_future.result()
+
+        # Get annual only variables (in dataset order, so the sector sum is
+        # reproducible run to run)
+        annual_only_vars = [
+            v for v in annual.data.data_vars if v not in monthly.data.data_vars
+        ]
+
+        # Sum sectors per inventory, then add the annual-only total repeated
+        # to monthly freq; see _add_annual_total
+        monthly_total = inventories.sum_sectors(monthly.data)
+        if not annual_only_vars:
+            return monthly_total
+        annual_total = inventories.sum_sectors(annual.data[annual_only_vars])
+        return _add_annual_total(monthly_total, annual_total)
+
+    express = prepare(express=True)  # dont scale by month
+
+    # Sum sectors
+    return inventories.sum_sectors(express.data)
+
+
+def _weights_file(total_key: tuple, out_grid) -> Path | None:
+    """Persistent xESMF weight file for a domain, or None without SLV_USER_DATA_DIR."""
+    data_dir = os.environ.get("SLV_USER_DATA_DIR")
+    if not data_dir:
+        return None
+    h = hashlib.sha256(repr(total_key).encode())
+    for coord in ("lon", "lat"):
+        h.update(out_grid[coord].values.tobytes())
+    return (
+        Path(data_dir) / "regrid_weights" / f"epa_conservative_{h.hexdigest()[:12]}.nc"
+    )
 
-        # Sum sectors
-        total = inventories.sum_sectors(express.data)
 
-    # Regrid
+def _regridder_key(total, out_grid, total_key: tuple):
+    """Cache key for _epa_regridder: the inventory key and target coordinates."""
+    return (
+        total_key,
+        out_grid["lon"].values.tobytes(),
+        out_grid["lat"].values.tobytes(),
+    )
+
+
+@keyed_lru_cache(maxsize=4, key=_regridder_key)
+def _epa_regridder(total, out_grid, total_key: tuple):
+    """Conservative regridder from the EPA grid to ``out_grid``.
+
+    Memoized for the process (LRU, 4 entries) on the inventory key and the
+    target lon/lat coordinates, so the ESMF weights are computed once per
+    domain. If ``SLV_USER_DATA_DIR`` is set, the weights are
+    also written to ``$SLV_USER_DATA_DIR/regrid_weights/`` and reused by later
+    processes.
+    """
     import xesmf as xe  # conda-forge only; lazy to avoid import-time failure
 
-    regridder = xe.Regridder(total, out_grid, method="conservative")
+    weights = _weights_file(total_key, out_grid)
+    if weights is not None and weights.exists():
+        print(f"Loading cached regridding weights from {weights}")
+        regridder = xe.Regridder(
+            total,
+            out_grid,
+            method="conservative",
+            filename=str(weights),
+            reuse_weights=True,
+        )
+    else:
+        regridder = xe.Regridder(total, out_grid, method="conservative")
+        if weights is not None:
+            weights.parent.mkdir(parents=True, exist_ok=True)
+            print(f"Saving regridding weights to {weights}")
+            regridder.to_netcdf(str(weights))
+    return regridder
+
+
+def load_epa_prior(
+    out_grid,
+    flux_times,
+    flux_freq=None,
+    bbox=None,
+    extent=None,
+    units=None,
+    express=False,
+    return_regridder=False,
+):
+    total_key = (_as_key(bbox), _as_key(extent), units, bool(express))
+    total = _load_epa_total(*total_key)
+
+    # Regrid
+    regridder = _epa_regridder(total, out_grid, total_key)
     inventory: xr.Dataset = regridder(total)
 
     inventory.name = "flux"  # Rename emissions
@@ -126,8 +213,13 @@ def load_epa_prior(
             if target_step > inv_step:
                 inventory = inventory.resample(time=flux_freq).mean()
 
-    # Align to exact flux_times (nearest-neighbor fills finer-than-inventory requests)
-    prior = inventory.reindex(time=flux_times, method="nearest").to_series()
+    # Align to exact flux_times (nearest-neighbor fills finer-than-inventory
+    # requests). Same lookup reindex(method="nearest") performs, then a positional
+    # take, skipping xarray's alignment machinery.
+    flux_times = pd.DatetimeIndex(flux_times)
+    nearest = inventory.indexes["time"].get_indexer(flux_times, method="nearest")
+    inventory = inventory.isel(time=nearest).assign_coords(time=flux_times)
+    prior = inventory.to_series()
 
     if return_regridder:
         return prior, regridder
@@ -87,6 +87,7 @@ _NON_SCIENTIFIC_FIELDS = frozenset(
         "plot_inputs",
         "plot_results",
         "plot_diagnostics",
+        "save_figures",
         "stilt_project",
         "num_processes",
         "timeout",
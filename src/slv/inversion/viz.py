@@ -2,60 +2,43 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from lair.geo import PC, add_latlon_ticks
+from shapely.geometry import box
 
 from slv.emissions.point_sources import plot_point_sources
 
 
 def plot_sites(ax, sites, site_config, color="black"):
     # Plot all mobile and stationary sites, but only return one handle/label for each type
-    mobile_marker = "^"
-    stationary_marker = "o"
-    mobile_sites = []
-    stationary_sites = []
-    for site in sites:
-        is_mobile = False
-        if "type" in site_config.columns:
-            is_mobile = site_config.at[site, "type"].lower() == "mobile"
-        elif "mobile" in site.lower():
-            is_mobile = True
-        if is_mobile:
-            mobile_sites.append(site)
-        else:
-            stationary_sites.append(site)
+    sites = list(sites)
+    coords = site_config.loc[sites, ["longitude", "latitude"]].to_numpy(dtype=float)
+    if "type" in site_config.columns:
+        is_mobile = site_config.loc[sites, "type"].str.lower().eq("mobile").to_numpy()
+    else:
+        is_mobile = np.array(["mobile" in site.lower() for site in sites], dtype=bool)
+
     handles = []
     labels = []
-    # Plot stationary sites
-    if stationary_sites:
-        h_stat = ax.scatter(
-            site_config.loc[stationary_sites, "longitude"],
-            site_config.loc[stationary_sites, "latitude"],
+    # One scatter per site type: stationary, then mobile
+    for mask, label, marker, size in (
+        (~is_mobile, "Stationary Site", "o", 100),
+        (is_mobile, "Mobile Site", "^", 120),
+    ):
+        if not mask.any():
+            continue
+        handle = ax.scatter(
+            coords[mask, 0],
+            coords[mask, 1],
             transform=PC,
-            label="Stationary Site",
+            label=label,
             c=color,
-            marker=stationary_marker,
-            s=100,
+            marker=marker,
+            s=size,
             edgecolor="white",
             linewidth=1.5,
             zorder=10,
         )
-        handles.append(h_stat)
-        labels.append("Stationary Site")
-    # Plot mobile sites
-    if mobile_sites:
-        h_mob = ax.scatter(
-            site_config.loc[mobile_sites, "longitude"],
-            site_config.loc[mobile_sites, "latitude"],
-            transform=PC,
-            label="Mobile Site",
-            c=color,
-            marker=mobile_marker,
-            s=120,
-            edgecolor="white",
-            linewidth=1.5,
-            zorder=10,
-        )
-        handles.append(h_mob)
-        labels.append("Mobile Site")
+        handles.append(handle)
+        labels.append(label)
     return handles, labels
 
 
@@ -97,6 +80,7 @@ def plot_grid(
         ec="black",
         linewidth=1.5,
         zorder=1,
+        rasterized=True,
     )
 
     # --- Plot point sources and collect legend handles ---
@@ -119,7 +103,7 @@ def plot_grid(
             )
             ps_handles.append(h)
             ps_labels.append(ps_type.title())
-            plot_point_sources(ax=ax, kind=ps_type, color=color)
+            plot_point_sources(ax=ax, kind=ps_type, color=color, rasterized=True)
 
     # --- Plot sites and collect handles ---
     site_handles, site_labels = [], []
@@ -214,6 +198,7 @@ def plot_inventory(inventory, extent, tiler, zoom, subplot_kwargs=None):
         cmap="Reds",
         alpha=0.55,
         cbar_kwargs={"label": "CH$_4$ Flux [umol/m$^2$/s]"},
+        rasterized=True,
     )
 
     add_latlon_ticks(ax, extent, x_rotation=45)
@@ -276,6 +261,7 @@ def _plot_flux_with_coverage(
         cmap=cmap,
         alpha=0.55,
         cbar_kwargs={"label": "CH$_4$ Flux [umol/m$^2$/s]"},
+        rasterized=True,
     )
 
     shade_removed_cells(ax, retained_cells, all_cells, dx, dy)
@@ -284,7 +270,7 @@ def _plot_flux_with_coverage(
         add_point_sources = {"landfill": "yellow", "refinery": "cyan"}
     if add_point_sources:
         for ps_type, color in add_point_sources.items():
-            plot_point_sources(ax=ax, kind=ps_type, color=color)
+            plot_point_sources(ax=ax, kind=ps_type, color=color, rasterized=True)
     if add_sites and sites is not None and site_config is not None:
         plot_sites(ax, sites=sites, site_config=site_config, color=site_color)
 
@@ -359,6 +345,10 @@ def plot_fluxes(
     add_point_sources=None,
 ):
     fig, axes = problem.plot.fluxes(tiler=tiler, tiler_zoom=zoom)
+    # Rasterize the flux meshes drawn by fips; overlays below are added per call
+    for ax in axes:
+        for collection in ax.collections:
+            collection.set_rasterized(True)
 
     if add_point_sources is None:
         add_point_sources = {
@@ -369,11 +359,25 @@ def plot_fluxes(
     for ax in axes:
         if add_point_sources:
             for ps_type, color in add_point_sources.items():
-                plot_point_sources(ax=ax, kind=ps_type, color=color)
+                plot_point_sources(ax=ax, kind=ps_type, color=color, rasterized=True)
         if add_sites and sites is not None and site_config is not None:
             plot_sites(ax, sites=sites, site_config=site_config, color=site_color)
 
 
+def _posterior_xarray(problem):
+    """Posterior fluxes as a float32 DataArray, memoized on *problem* per solve.
+
+    The pandas -> xarray unstack of the full (time, lat, lon) posterior is the
+    costly part of redrawing the timestep facets; float32 is ample for colors.
+    """
+    estimator = getattr(problem, "estimator", None)
+    cached = getattr(problem, "_posterior_xr", None)
+    if cached is None or cached[0] is not estimator:
+        da = problem.posterior_fluxes.to_xarray().astype("float32")
+        cached = problem._posterior_xr = (estimator, da)
+    return cached[1]
+
+
 def plot_fluxes_by_timestep(
     problem,
     extent,
@@ -385,24 +389,29 @@ def plot_fluxes_by_timestep(
     site_color="black",
     add_point_sources=None,
 ):
-    facet = (
-        problem.posterior_fluxes.to_xarray()
-        .astype(float)
-        .plot(
-            col="time",
-            col_wrap=8,
-            subplot_kws={"projection": tiler.crs},
-            transform=PC,
-            alpha=0.6,
-            cmap="coolwarm",
-        )
+    facet = _posterior_xarray(problem).plot(
+        col="time",
+        col_wrap=8,
+        subplot_kws={"projection": tiler.crs},
+        transform=PC,
+        alpha=0.6,
+        cmap="coolwarm",
+        rasterized=True,
     )
+    # Every facet shares the extent, so fetch and merge the basemap tiles once
+    # (as ax.add_image would per axes) and draw the same image on each
+    basemap = None
     for ax in facet.axes.flatten():
         ax.set_extent(extent, crs=PC)
-        ax.add_image(tiler, zoom)
+        if basemap is None:
+            x0, x1, y0, y1 = ax.get_extent(crs=tiler.crs)
+            basemap = tiler.image_for_domain(box(x0, y0, x1, y1), zoom)
+        img, img_extent, origin = basemap
+        ax.imshow(img, extent=img_extent, origin=origin, transform=tiler.crs)
+        ax.set_extent(extent, crs=PC)  # imshow resets limits to the tile extent
         if add_point_sources:
             for ps_type, color in add_point_sources.items():
-                plot_point_sources(ax=ax, kind=ps_type, color=color)
+                plot_point_sources(ax=ax, kind=ps_type, color=color, rasterized=True)
         if add_sites and sites is not None and site_config is not None:
             plot_sites(ax, sites=sites, site_config=site_config, color=site_color)
 
@@ -8,6 +8,52 @@ from scipy.spatial import cKDTree
 from slv.measurements import instruments
 
 
+def _group_codes(df: pd.DataFrame, keys, sort: bool = False) -> np.ndarray:
+    """Integer group code per row of *df* grouped by *keys*.
+
+    Rows whose key contains NaN (which groupby leaves out) get ``-1``. Sizes and
+    per-group lookups can then run on the codes with ``np.bincount`` / plain
+    indexing instead of a Python callback per group (``groupby(...).filter``).
+    With ``sort=True`` the codes follow the sorted key order of ``groupby``.
+    """
+    codes = df.groupby(keys, sort=sort).ngroup().to_numpy(dtype=float)
+    return np.where(np.isnan(codes), -1, codes).astype(np.int64)
+
+
+def _grouped_mean(df: pd.DataFrame, keys: list[str], cols) -> pd.DataFrame:
+    """NaN-skipping mean of *cols* per *keys* group, plus joined instruments.
+
+    Same result as ``df.groupby(keys).agg({col: "mean", ..., "instrument":
+    join}).reset_index()``, but the means are ``np.bincount`` sums / counts over
+    the group codes rather than pandas' per-group reduction.
+    """
+    codes = _group_codes(df, keys, sort=True)
+    valid = codes >= 0
+    c = codes[valid]
+    n = int(c.max()) + 1 if c.size else 0
+    _, first = np.unique(c, return_index=True)
+
+    out = df.loc[valid, keys].iloc[first].reset_index(drop=True)
+    for col in cols:
+        x = df[col].to_numpy(dtype=float)[valid]
+        ok = ~np.isnan(x)
+        total = np.bincount(c[ok], weights=x[ok], minlength=n)
+        count = np.bincount(c[ok], minlength=n)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out[col] = total / count  # NaN where a group has no valid values
+
+    instruments = pd.DataFrame(
+        {"code": c, "instrument": df["instrument"].to_numpy()[valid]}
+    ).drop_duplicates()
+    out["instrument"] = (
+        instruments.sort_values(["code", "instrument"])
+        .groupby("code")["instrument"]
+        .agg(" ".join)
+        .to_numpy()
+    )
+    return out
+
+
 def aggregate_obs(
     obs: pd.DataFrame,
     by: str | list[str] | Callable | None = None,
@@ -75,17 +121,26 @@ def aggregate_obs(
                     stationary["_expected"] = stationary["instrument"].map(
                         inst_expected
                     )
-                    stationary = stationary.groupby(group_keys).filter(
-                        lambda g: len(g) / g["_expected"].iloc[0]
-                        >= stationary_min_percent
-                    )
-                    stationary = stationary.drop(columns="_expected")
+                    codes = _group_codes(stationary, group_keys)
+                    valid = codes >= 0
+                    counts = np.bincount(codes[valid])
+                    # expected count of each group = that of its first row
+                    _, first = np.unique(codes[valid], return_index=True)
+                    expected = stationary["_expected"].to_numpy()[valid][first]
+                    keep = np.zeros(len(stationary), dtype=bool)
+                    keep[valid] = (counts / expected >= stationary_min_percent)[
+                        codes[valid]
+                    ]
+                    stationary = stationary[keep].drop(columns="_expected")
 
             if not stationary.empty:
                 numeric_cols = stationary.select_dtypes(include="number").columns
                 agg_dict = {col: func for col in numeric_cols if col not in group_keys}
-                agg_dict["instrument"] = lambda x: " ".join(sorted(x.unique()))
-                grouped = stationary.groupby(group_keys).agg(agg_dict).reset_index()
+                if func == "mean" and all(k in stationary.columns for k in group_keys):
+                    grouped = _grouped_mean(stationary, group_keys, agg_dict)
+                else:
+                    agg_dict["instrument"] = lambda x: " ".join(sorted(x.unique()))
+                    grouped = stationary.groupby(group_keys).agg(agg_dict).reset_index()
                 agg_frames.append(grouped.rename(columns={"agg_time": "Time_UTC"}))
         else:
             agg_frames.append(stationary)
@@ -131,18 +186,23 @@ def aggregate_obs(
                 group_keys.append("agg_time")
 
         if mobile_min_count is not None:
-            mobile = mobile.groupby(group_keys).filter(
-                lambda g: len(g) >= mobile_min_count
-            )
+            codes = _group_codes(mobile, group_keys)
+            valid = codes >= 0
+            keep = np.zeros(len(mobile), dtype=bool)
+            keep[valid] = np.bincount(codes[valid])[codes[valid]] >= mobile_min_count
+            mobile = mobile[keep]
 
         numeric_cols = mobile.select_dtypes(include="number").columns
         # When spatial binning is active, lat/lon come from renamed bin columns
         spatial_active = mobile_points is not None or mobile_grid_res is not None
         exclude = group_keys + (["latitude", "longitude"] if spatial_active else [])
         agg_dict = {col: func for col in numeric_cols if col not in exclude}
-        agg_dict["instrument"] = lambda x: " ".join(sorted(x.unique()))
 
-        grouped = mobile.groupby(group_keys).agg(agg_dict).reset_index()
+        if func == "mean" and all(k in mobile.columns for k in group_keys):
+            grouped = _grouped_mean(mobile, group_keys, agg_dict)
+        else:
+            agg_dict["instrument"] = lambda x: " ".join(sorted(x.unique()))
+            grouped = mobile.groupby(group_keys).agg(agg_dict).reset_index()
         agg_frames.append(
             grouped.rename(
                 columns={
@@ -3,7 +3,10 @@ Background module for the SLV
 """
 
 import datetime as dt
+import os
+import time
 from functools import cached_property
+from pathlib import Path
 
 import pandas as pd
 import uataq
@@ -14,6 +17,26 @@ from lair.background import rolling_baseline, thoning
 from slv.domain import SLV_LAT, SLV_LON, UT_BBOX
 
 
+def _subgroup_resample(
+    series: pd.Series, rule: str = "1h", max_gap: str = "7d"
+) -> pd.Series:
+    """Mean-resample *series* to *rule* separately within each gap-free run.
+
+    A plain ``resample`` over a multi-year record with long outages materializes
+    every empty bin between the first and last timestamp. Splitting wherever
+    consecutive samples are more than *max_gap* apart and resampling each run on
+    its own only creates bins around actual data; the outages are left out of the
+    index instead of being filled with NaN rows.
+    """
+    series = series.sort_index()
+    if series.empty:
+        return series.resample(rule).mean()
+    runs = (series.index.to_series().diff() > pd.Timedelta(max_gap)).cumsum()
+    return pd.concat(
+        [chunk.resample(rule).mean() for _, chunk in series.groupby(runs.to_numpy())]
+    )
+
+
 class CarbonTrackerCH4(noaa.CarbonTrackerCH4):
     """
     NOAA GML CarbonTracker CH4 subclass specifically for the SLV
@@ -102,16 +125,52 @@ class UTAFlask(GMLDiscrete):
 class UATAQCH4:
     """
     UATAQ Background Data
+
+    Parameters
+    ----------
+    cache_dir : str | Path | None
+        Directory for the hourly-resampled observations of each site, so later
+        processes skip ``uataq.get_obs``. Defaults to
+        ``$SLV_USER_DATA_DIR/uataq`` when that variable is set, otherwise no
+        on-disk cache is used.
+    max_age : str
+        Age (as a pandas timedelta string) after which a cached file is
+        considered stale and re-read from UATAQ, so new data is picked up.
     """
 
-    def __init__(self):
+    def __init__(self, cache_dir: str | Path | None = None, max_age: str = "1D"):
         self._data = {}
+        if cache_dir is None and os.environ.get("SLV_USER_DATA_DIR"):
+            cache_dir = Path(os.environ["SLV_USER_DATA_DIR"]) / "uataq"
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_age = pd.Timedelta(max_age)
 
     def __getitem__(self, key) -> pd.DataFrame:
         if key not in self._data:
             self._data[key] = self._get_data(key)
         return self._data[key]
 
+    def _load_hourly(self, site: str) -> pd.Series:
+        """Hourly CH4 for *site*, from the on-disk cache while it is fresh."""
+        path = None
+        if self.cache_dir is not None:
+            path = self.cache_dir / f"{site}_CH4_hourly.pkl"
+            if (
+                path.exists()
+                and time.time() - path.stat().st_mtime < self.max_age.total_seconds()
+            ):
+                return pd.read_pickle(path)
+
+        data = uataq.get_obs(site, "CH4")["CH4d_ppm_cal"].dropna().rename("CH4")
+
+        # Resample to hourly (skipping multi-day outages)
+        data = _subgroup_resample(data, "1h")
+
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            data.to_pickle(path)
+        return data
+
     def _get_data(self, key: str) -> pd.Series:
         # Parse key
         if "_" in key:
@@ -120,16 +179,8 @@ class UATAQCH4:
             site = key
             method = None
 
-        # Get data
-        if site in self._data:
-            data = self._data[site]
-        else:
-            data = uataq.get_obs(site, "CH4")["CH4d_ppm_cal"].dropna()
-
-        data = data.rename("CH4")
-
-        # Resample to hourly
-        data = data.resample("1h").mean()
+        # Get hourly data
+        data = self._data[site] if site in self._data else self._load_hourly(site)
 
         # Apply method
         if method and method == "base":
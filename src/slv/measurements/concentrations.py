@@ -1,5 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import uataq
 from uataq.timerange import TimeRange
@@ -11,6 +13,211 @@ from slv.measurements.pollutants import normalize_pollutant
 from slv.measurements.sites import load_site_config
 from slv.meteorology.pcaps import filter_pcap_events
 
+#: Hours subtracted from UTC to get Mountain Standard Time
+_MST_OFFSET_HOURS = 7
+
+
+def _in_hours(times: pd.Series, hours: list[int]) -> np.ndarray:
+    """Boolean mask of ``times`` whose hour of day is in ``hours``.
+
+    Tests each hour against a 24-bit mask built from ``hours`` instead of
+    materializing ``.dt.hour`` and hashing it through ``isin``.
+    """
+    bits = 0
+    for h in hours:
+        bits |= 1 << int(h)
+    values = times.to_numpy(dtype="datetime64[ns]")
+    hour = (values.view("i8") // 3_600_000_000_000) % 24
+    # NaT views as int64 min, which would otherwise land on hour 0
+    return ((bits >> hour) & 1).astype(bool) & ~np.isnat(values)
+
+
+def _mst_to_utc_hours(hours: list[int]) -> list[int]:
+    """Convert MST hours of day to UTC hours of day.
+
+    Hours outside ``0 <= h < 24`` are dropped rather than wrapped, matching
+    an hour-of-day ``isin`` test, which never matches them.
+    """
+    return [(int(h) + _MST_OFFSET_HOURS) % 24 for h in hours if 0 <= int(h) < 24]
+
+
+def _read_daq_file(path: Path, time_range: TimeRange | None) -> pd.DataFrame:
+    """Read one DAQ ``.dat`` file indexed by time, trimmed to ``time_range``.
+
+    Trimming per file keeps only the requested slice of each file in memory
+    before the files are concatenated.
+    """
+    df = pd.read_csv(path, parse_dates=["Time_UTC"], index_col="Time_UTC")
+    if time_range is not None:
+        df = df.sort_index().loc[time_range.start : time_range.stop]
+    return df
+
+
+def _load_site(
+    site: str,
+    site_config: pd.DataFrame,
+    pollutants: list[str],
+    time_range: TimeRange,
+    include_location: bool,
+    has_mobile: bool,
+    valid_range: dict[str, tuple[float, float]] | None,
+    valid_flags: dict[str, set] | None,
+    num_processes: int,
+    mobile_kwargs: dict | None,
+    subset_hours_utc: list[int] | None = None,
+) -> tuple[str, pd.DataFrame] | None:
+    """Load and normalize all instruments for one site.
+
+    Returns ``(org, site_obs)``, or None if nothing was loaded. The constant
+    ``site``/``org`` labels are added by the caller after concatenation. Rows
+    outside ``subset_hours_utc`` are dropped as soon as their time is final
+    (after reading for stationary sites, after the GPS merge for mobile ones).
+    """
+    try:
+        config = site_config.loc[site]
+        if isinstance(config, pd.DataFrame):
+            config = config.iloc[0]
+    except KeyError:
+        print(f"Site {site} not found in site_config. Skipping.")
+        return None
+
+    org = config["organization"]
+    site_type = config["type"]
+    instrument_list = config["instruments"].split()
+
+    inst_dfs: list[pd.DataFrame] = []
+    for instr_name in instrument_list:
+        # Find instrument class
+        instr_class = instruments.REGISTRY.get(instr_name)
+        if instr_class is None:
+            print(f"Instrument {instr_name} not recognized for site {site}.")
+            continue
+
+        # Check if instrument supports any of the requested pollutants
+        supported_pollutants = [
+            pol for pol in pollutants if pol in instr_class.pollutants
+        ]
+        if not supported_pollutants:
+            print(
+                f"Instrument {instr_name} does not support any requested pollutants for site {site}."
+            )
+            continue
+
+        # Load data based on organization and instrument
+        lvl = "calibrated" if getattr(instr_class, "calibrated", True) else "qaqc"
+
+        # --- UATAQ ---
+        if org == "UATAQ":
+            try:
+                df = uataq.read_data(
+                    site,
+                    instruments=instr_name,
+                    lvl=lvl,
+                    time_range=time_range,
+                    num_processes=num_processes,
+                )[instr_name].reset_index()
+            except Exception as e:
+                print(f"Failed to load {instr_name} for {site}: {e}")
+                continue
+
+        # -- DAQ with Picarro G2307 ---
+        elif org == "DAQ" and instr_name == "picarro_g2307":
+            data_dir = Path(get_data_dir("SLV_DAQ_DIR")) / "formaldehyde_methane/data"
+            pattern = f"{site}/picarro_g2307/{lvl}/*.dat"
+            files = sorted(data_dir.rglob(pattern))
+            if not files:
+                print(
+                    f"No DAQ files found for {site}. Skipping instrument {instr_name}."
+                )
+                continue
+            # Files are independent and I/O bound; read them on threads
+            n_workers = max(1, min(num_processes, len(files)))
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                frames = list(
+                    executor.map(lambda f: _read_daq_file(f, time_range), files)
+                )
+            df = pd.concat(frames)
+            # Trimmed files are each sorted; only re-sort if they interleave
+            if not df.index.is_monotonic_increasing:
+                df = df.sort_index()
+            df = df.reset_index()
+
+            # ID column is built from CH4
+            df = df.rename(
+                columns={
+                    "ID": "ID_CH4",
+                }
+            )
+            df["ID_H2CO"] = df["ID_CH4"]
+
+        else:
+            print(f"Unknown org/instrument combo for site {site}: {org}/{instr_name}")
+            continue
+
+        if df.empty:
+            print(f"No data for {site} instrument {instr_name}. Skipping.")
+            continue
+
+        df["Time_UTC"] = pd.to_datetime(df["Time_UTC"])
+        if subset_hours_utc is not None and site_type != "mobile":
+            df = df[_in_hours(df["Time_UTC"], subset_hours_utc)]
+        df["instrument"] = instr_name
+
+        # Normalize columns for each supported pollutant
+        for pol in supported_pollutants:
+            pol_range = valid_range.get(pol) if valid_range else None
+            pol_flags = valid_flags.get(pol) if valid_flags else None
+            conc_col = instr_class.pollutants[pol]
+            if conc_col in df.columns:
+                df = df.rename(columns={conc_col: pol})
+            df[pol] = normalize_pollutant(df, pol, pol_range, pol_flags)
+
+        # Drop rows where all pollutants are NaN
+        df = df.dropna(subset=supported_pollutants, how="all")
+
+        inst_dfs.append(df)
+
+    if inst_dfs:
+        # Combine instruments for this site
+        site_obs = pd.concat(inst_dfs, ignore_index=True)
+
+        if site_type == "mobile":
+            # For mobile sites, attempt to merge with GPS data
+            site_obs = merge_with_gps(
+                site=site,
+                org=org,
+                obs=site_obs,
+                time_range=time_range,
+                num_processes=num_processes,
+                **mobile_kwargs if mobile_kwargs is not None else {},
+            ).rename(
+                columns={
+                    "Latitude_deg": "latitude",
+                    "Longitude_deg": "longitude",
+                    "Altitude_msl": "altitude",
+                }
+            )
+            if subset_hours_utc is not None:
+                # Mobile times come from the GPS merge, so filter afterwards
+                site_obs = site_obs[_in_hours(site_obs["Time_UTC"], subset_hours_utc)]
+
+        elif include_location:
+            # For stationary sites, add location from config
+            site_obs["latitude"] = config["latitude"]
+            site_obs["longitude"] = config["longitude"]
+
+        if site_type == "mobile" or include_location:
+            # Add height above ground column
+            site_obs["height"] = config["height_agl"]
+
+        if has_mobile:
+            # Add is_mobile column
+            site_obs["is_mobile"] = site_type == "mobile"
+
+        return org, site_obs
+
+    return None
+
 
 def load_concentrations(
     pollutants: list[str] | str,
@@ -59,162 +266,53 @@ def load_concentrations(
             # force include_location to True if any site is mobile
             include_location = True
 
-    site_dfs: list[pd.DataFrame] = []
-    for site in sites:
-        try:
-            config = site_config.loc[site]
-            if isinstance(config, pd.DataFrame):
-                config = config.iloc[0]
-        except KeyError:
-            print(f"Site {site} not found in site_config. Skipping.")
-            continue
-
-        org = config["organization"]
-        site_type = config["type"]
-        instrument_list = config["instruments"].split()
-
-        inst_dfs: list[pd.DataFrame] = []
-        for instr_name in instrument_list:
-            # Find instrument class
-            instr_class = instruments.REGISTRY.get(instr_name)
-            if instr_class is None:
-                print(f"Instrument {instr_name} not recognized for site {site}.")
-                continue
-
-            # Check if instrument supports any of the requested pollutants
-            supported_pollutants = [
-                pol for pol in pollutants if pol in instr_class.pollutants
-            ]
-            if not supported_pollutants:
-                print(
-                    f"Instrument {instr_name} does not support any requested pollutants for site {site}."
-                )
-                continue
-
-            # Load data based on organization and instrument
-            lvl = "calibrated" if getattr(instr_class, "calibrated", True) else "qaqc"
-
-            # --- UATAQ ---
-            if org == "UATAQ":
-                try:
-                    df = uataq.read_data(
-                        site,
-                        instruments=instr_name,
-                        lvl=lvl,
-                        time_range=time_range,
-                        num_processes=num_processes,
-                    )[instr_name].reset_index()
-                except Exception as e:
-                    print(f"Failed to load {instr_name} for {site}: {e}")
-                    continue
-
-            # -- DAQ with Picarro G2307 ---
-            elif org == "DAQ" and instr_name == "picarro_g2307":
-                data_dir = (
-                    Path(get_data_dir("SLV_DAQ_DIR")) / "formaldehyde_methane/data"
-                )
-                pattern = f"{site}/picarro_g2307/{lvl}/*.dat"
-                files = list(data_dir.rglob(pattern))
-                if not files:
-                    print(
-                        f"No DAQ files found for {site}. Skipping instrument {instr_name}."
-                    )
-                    continue
-                df = pd.concat(
-                    [pd.read_csv(f, parse_dates=["Time_UTC"]) for f in files]
-                )
-                if time_range is not None:
-                    df = df.set_index("Time_UTC").sort_index()
-                    df = df.loc[time_range.start : time_range.stop].reset_index()
-
-                # ID column is built from CH4
-                df = df.rename(
-                    columns={
-                        "ID": "ID_CH4",
-                    }
-                )
-                df["ID_H2CO"] = df["ID_CH4"]
-
-            else:
-                print(
-                    f"Unknown org/instrument combo for site {site}: {org}/{instr_name}"
-                )
-                continue
-
-            if df.empty:
-                print(f"No data for {site} instrument {instr_name}. Skipping.")
-                continue
-
-            df["Time_UTC"] = pd.to_datetime(df["Time_UTC"])
-            df["instrument"] = instr_name
-
-            # Normalize columns for each supported pollutant
-            for pol in supported_pollutants:
-                pol_range = valid_range.get(pol) if valid_range else None
-                pol_flags = valid_flags.get(pol) if valid_flags else None
-                conc_col = instr_class.pollutants[pol]
-                if conc_col in df.columns:
-                    df = df.rename(columns={conc_col: pol})
-                df[pol] = normalize_pollutant(df, pol, pol_range, pol_flags)
-
-            # Drop rows where all pollutants are NaN
-            df = df.dropna(subset=supported_pollutants, how="all")
-
-            inst_dfs.append(df)
-
-        if inst_dfs:
-            # Combine instruments for this site
-            site_obs = pd.concat(inst_dfs, ignore_index=True)
-
-            if site_type == "mobile":
-                # For mobile sites, attempt to merge with GPS data
-                site_obs = merge_with_gps(
-                    site=site,
-                    org=org,
-                    obs=site_obs,
-                    time_range=time_range,
-                    num_processes=num_processes,
-                    **mobile_kwargs if mobile_kwargs is not None else {},
-                ).rename(
-                    columns={
-                        "Latitude_deg": "latitude",
-                        "Longitude_deg": "longitude",
-                        "Altitude_msl": "altitude",
-                    }
+    # Hour subset is given in MST; filter on the equivalent UTC hours while loading
+    subset_hours_utc = None if subset_hours is None else _mst_to_utc_hours(subset_hours)
+
+    load_kwargs = dict(
+        site_config=site_config,
+        pollutants=pollutants,
+        time_range=time_range,
+        include_location=include_location,
+        has_mobile=has_mobile,
+        valid_range=valid_range,
+        valid_flags=valid_flags,
+        mobile_kwargs=mobile_kwargs,
+        subset_hours_utc=subset_hours_utc,
+    )
+    n_workers = min(num_processes, len(sites))
+    if n_workers > 1:
+        # Site reads are I/O bound and independent: overlap them in threads and
+        # keep each reader single-process to avoid oversubscription.
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            results = list(
+                executor.map(
+                    lambda s: _load_site(s, num_processes=1, **load_kwargs), sites
                 )
-
-            elif include_location:
-                # For stationary sites, add location from config
-                site_obs["latitude"] = config["latitude"]
-                site_obs["longitude"] = config["longitude"]
-
-            if site_type == "mobile" or include_location:
-                # Add height above ground column
-                site_obs["height"] = config["height_agl"]
-
-            if has_mobile:
-                # Add is_mobile column
-                site_obs["is_mobile"] = site_type == "mobile"
-
-            site_obs["site"] = site
-            site_obs["org"] = org
-
-            site_dfs.append(site_obs)
-
-    if not site_dfs:
+            )
+    else:
+        results = [
+            _load_site(s, num_processes=num_processes, **load_kwargs) for s in sites
+        ]
+    loaded = [
+        (site, res) for site, res in zip(sites, results, strict=True) if res is not None
+    ]
+
+    if not loaded:
         raise ValueError("No data loaded for any requested sites/instruments.")
 
-    # Combine all sites into single DataFrame
+    # Combine all sites into single DataFrame, labelling site/org once on the
+    # combined frame instead of broadcasting a string column per site
+    site_dfs = [site_obs for _, (_, site_obs) in loaded]
+    lengths = [len(site_obs) for site_obs in site_dfs]
     obs = pd.concat(site_dfs, ignore_index=True)
-    obs = obs.sort_values(["Time_UTC", "site"]).reset_index(drop=True)
+    obs["site"] = np.repeat([site for site, _ in loaded], lengths)
+    obs["org"] = np.repeat([org for _, (org, _) in loaded], lengths)
+    obs = obs.sort_values(["Time_UTC", "site"], ignore_index=True)
 
     # Calculate mountain standard time
     # TODO this is hardcoded, any easy way to get Local Standard Time offset for each site?
-    obs["Time_MST"] = obs.Time_UTC - pd.to_timedelta("7h")
-
-    if subset_hours is not None:
-        # Filter to specified hours of day (MOUNTAIN STANDARD TIME)
-        obs = obs[obs["Time_MST"].dt.hour.isin(subset_hours)]
+    obs["Time_MST"] = obs.Time_UTC - pd.Timedelta(hours=_MST_OFFSET_HOURS)
 
     if filter_pcaps and not obs.empty:
         # Filter out PCAP events
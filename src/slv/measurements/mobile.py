@@ -2,9 +2,10 @@ from pathlib import Path
 
 import cartopy.crs as ccrs
 import geopandas as gpd
+import numpy as np
 import uataq
 from lair.geo import points_along_line
-from shapely import Point
+from shapely import Point, STRtree
 
 from slv import get_data_dir
 
@@ -128,30 +129,30 @@ def merge_with_gps(
     else:
         raise ValueError(f"Organization {org} not supported for GPS loading.")
 
-    # Trim altitude outliers
-    gps = gps[
-        (gps.Altitude_msl > gps.Altitude_msl.quantile(0.01))
-        & (gps.Altitude_msl < gps.Altitude_msl.quantile(0.99))
-    ]
+    # Trim altitude outliers (both quantiles from one partition of the column)
+    altitude = gps["Altitude_msl"].to_numpy(dtype=float)
+    lo, hi = np.nanquantile(altitude, [0.01, 0.99])
+    gps = gps[(altitude > lo) & (altitude < hi)]
 
-    # Filter to locations within buffer of routes
+    # Keep points within a route buffer and drop points inside the storage
+    # polygon, querying one spatial index over the GPS points for both
     routes = get_geodf(routes)
-    if routes is not None and route_buffer is not None:
-        print("Filtering GPS points near routes...")
-        routes_buff = gpd.GeoDataFrame(
-            geometry=routes.buffer(route_buffer), crs=routes.crs
-        )
-        routes_buff = routes_buff.to_crs("EPSG:4326")
-        gps = gpd.sjoin(gps, routes_buff, how="inner", predicate="within").drop(
-            columns=["index_right"]
-        )
-
-    # Remove gps points within storage polygon
     storage_polygon = get_geodf(storage_polygon)
-    if storage_polygon is not None:
-        print("Removing GPS points within storage polygon...")
-        gps = gpd.sjoin(gps, storage_polygon, how="left", predicate="within")
-        gps = gps[gps.index_right.isnull()].drop(columns=["index_right"])
+    filter_routes = routes is not None and route_buffer is not None
+    if filter_routes or storage_polygon is not None:
+        tree = STRtree(gps.geometry.to_numpy())
+        keep = np.full(len(gps), not filter_routes)
+        if filter_routes:
+            print("Filtering GPS points near routes...")
+            routes_buff = routes.buffer(route_buffer).to_crs(gps.crs)
+            _, near = tree.query(routes_buff.to_numpy(), predicate="contains")
+            keep[near] = True
+        if storage_polygon is not None:
+            print("Removing GPS points within storage polygon...")
+            storage = storage_polygon.geometry.to_crs(gps.crs)
+            _, stored = tree.query(storage.to_numpy(), predicate="contains")
+            keep[stored] = False
+        gps = gps[keep]
 
     gps = gps.drop(columns=["geometry"])
 
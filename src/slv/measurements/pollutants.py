@@ -35,15 +35,16 @@ def normalize_pollutant(
     if pollutant not in df.columns:
         raise ValueError(f"Pollutant column {pollutant} not found in DataFrame.")
 
-    values = df[pollutant].copy()
-    valid = pd.Series(True, index=df.index)
+    # Build the mask on the raw arrays: one boolean buffer, no aligned Series ops
+    values = df[pollutant].to_numpy(dtype=float, copy=True)
+    valid = np.ones(len(values), dtype=bool)
 
     id_col = f"ID_{pollutant}"
     if id_col in df.columns:
-        valid &= df[id_col] == -10
+        valid &= df[id_col].to_numpy() == -10
 
     if "QAQC_Flag" in df.columns:
-        valid &= df["QAQC_Flag"].isin(valid_flags)
+        valid &= np.isin(df["QAQC_Flag"].to_numpy(), list(valid_flags))
 
     if valid_range is not None:
         vmin, vmax = valid_range
@@ -51,4 +52,4 @@ def normalize_pollutant(
 
     values[~valid] = np.nan
 
-    return values
+    return pd.Series(values, index=df.index, name=pollutant)
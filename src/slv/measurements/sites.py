@@ -1,10 +1,16 @@
+from functools import lru_cache
 from importlib.resources import files
 
 import pandas as pd
 
 
+@lru_cache(maxsize=1)
 def load_site_config() -> pd.DataFrame:
-    """Loads the internal site_config.csv into a Pandas DataFrame."""
+    """Loads the internal site_config.csv into a Pandas DataFrame.
+
+    The file is read once per process and the same DataFrame is returned on
+    every call, so treat it as read-only (``.copy()`` before modifying).
+    """
 
     # Locate the file dynamically within the installed package
     csv_path = files(__package__).joinpath("site_config.csv")
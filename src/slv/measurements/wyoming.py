@@ -61,15 +61,17 @@ def read_met(file):
         on_bad_lines="skip",
         dtype={"UTC hhmmss": str},
     )
-    met_time = dict(
-        year=met["UTC Year"],
-        month=met["UTC Month"],
-        day=met["UTC Day"],
-        hour=met["UTC hhmmss"].str.slice(0, 2),
-        minute=met["UTC hhmmss"].str.slice(2, 4),
-        second=met["UTC hhmmss"].str.slice(4, None),
+    # Build the date once, then add hhmmss as seconds with integer arithmetic
+    date = pd.to_datetime(
+        dict(year=met["UTC Year"], month=met["UTC Month"], day=met["UTC Day"]),
+        errors="coerce",
+    )
+    hhmmss = pd.to_numeric(met["UTC hhmmss"], errors="coerce")
+    hours, rest = np.divmod(hhmmss, 10000)
+    minutes, seconds = np.divmod(rest, 100)
+    met["Time_UTC"] = date + pd.to_timedelta(
+        hours * 3600 + minutes * 60 + seconds, unit="s"
     )
-    met["Time_UTC"] = pd.to_datetime(met_time, errors="coerce")
     met = met.dropna(subset="Time_UTC").set_index("Time_UTC").sort_index()
     met = met[
         [
@@ -96,6 +98,45 @@ def read_met(file):
     return met
 
 
+def _interp_columns(x, xp, fp):
+    """
+    Linearly interpolate each column of ``fp`` from ``xp`` to ``x``.
+
+    Equivalent to ``np.interp(x, xp, fp[:, j])`` for every column ``j``
+    (including clamping to the end values outside ``xp`` and ignoring a NaN
+    neighbour when ``x`` sits exactly on a sample point), but the bracketing
+    indices and weights are computed once for all columns.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Points to evaluate at.
+    xp : np.ndarray
+        Increasing sample points.
+    fp : np.ndarray
+        Sample values, shape ``(len(xp), n_columns)``.
+
+    Returns
+    -------
+    np.ndarray
+        Interpolated values, shape ``(len(x), n_columns)``.
+    """
+    if len(xp) == 1:
+        return np.repeat(fp, len(x), axis=0)
+    idx = np.clip(np.searchsorted(xp, x, side="right") - 1, 0, len(xp) - 2)
+    x0 = xp[idx]
+    dx = xp[idx + 1] - x0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w = np.clip(np.where(dx > 0, (x - x0) / dx, 0.0), 0.0, 1.0)
+    w = w[:, None]
+    lo = fp[idx]
+    hi = fp[idx + 1]
+    # Pick the endpoint outright at w == 0 or 1 so a NaN on the other side
+    # does not leak in through 0 * NaN
+    with np.errstate(invalid="ignore"):
+        return np.where(w == 0, lo, np.where(w == 1, hi, lo + w * (hi - lo)))
+
+
 def merge_aeris_met(aeris, met):
     """
     Merge aeris and met dataframes, interpolating met data to match aeris timestamps
@@ -107,19 +148,38 @@ def merge_aeris_met(aeris, met):
     met : pd.DataFrame
         Met data
     """
-    data = aeris.copy(deep=True)
-    data["latitude"] = np.interp(data.index, met.index, met["latitude"])
-    data["longitude"] = np.interp(data.index, met.index, met["longitude"])
-    data["altitude"] = np.interp(data.index, met.index, met["Altitude (m)"])
-    data["wind_speed"] = np.interp(data.index, met.index, met["GPSCorWindSpeed (kts)"])
-    data["vehicle_speed"] = np.interp(data.index, met.index, met["VehicleSpeed"])
-
     met["u_wind"], met["v_wind"] = wind_components(
         met["GPSCorWindSpeed (kts)"], met["GPSCorWindDirTrue (deg)"]
     )
-    interp_u_wind = np.interp(data.index, met.index, met["u_wind"])
-    interp_v_wind = np.interp(data.index, met.index, met["v_wind"])
-    data["wind_direction"] = wind_direction(interp_u_wind, interp_v_wind)
+
+    # Interpolate every met column to the aeris timestamps in one pass
+    columns = {
+        "latitude": "latitude",
+        "longitude": "longitude",
+        "altitude": "Altitude (m)",
+        "wind_speed": "GPSCorWindSpeed (kts)",
+        "vehicle_speed": "VehicleSpeed",
+        "u_wind": "u_wind",
+        "v_wind": "v_wind",
+    }
+    interp = _interp_columns(
+        aeris.index.asi8.astype(float),
+        met.index.asi8.astype(float),
+        met[list(columns.values())].to_numpy(dtype=float),
+    )
+    interp = dict(zip(columns, interp.T, strict=True))
+    interp_u_wind = interp.pop("u_wind")
+    interp_v_wind = interp.pop("v_wind")
+    interp["wind_direction"] = wind_direction(interp_u_wind, interp_v_wind)
+
+    # Add the new columns in one concat rather than one insert per column
+    data = pd.concat(
+        [
+            aeris.drop(columns=list(interp), errors="ignore"),
+            pd.DataFrame(interp, index=aeris.index),
+        ],
+        axis=1,
+    )
 
     # Convert to geodataframe
     data = gpd.GeoDataFrame(
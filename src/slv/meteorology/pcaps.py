@@ -1,17 +1,35 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 
 import lair.pcaps
 import lair.soundings
+import numpy as np
 import pandas as pd
 
 from slv import get_data_dir
 
-PCAP_EVENTS_CSV = (
-    Path(data_dir) / "pcap_events.csv"
-    if (data_dir := os.environ.get("SLV_USER_DATA_DIR"))
-    else None
-)
+
+def _pcap_events_csv() -> Path | None:
+    """Path of the cached PCAP events CSV, or None without ``SLV_USER_DATA_DIR``.
+
+    Resolved at call time so the variable may be set after import.
+    """
+    data_dir = os.environ.get("SLV_USER_DATA_DIR")
+    return Path(data_dir) / "pcap_events.csv" if data_dir else None
+
+
+@lru_cache(maxsize=4)
+def _load_soundings(station, start, end, sounding_dir, months, driver, kwargs):
+    return lair.soundings.get_soundings(
+        station=station,
+        start=start,
+        end=end,
+        sounding_dir=sounding_dir,
+        months=None if months is None else list(months),
+        driver=driver,
+        **dict(kwargs),
+    )
 
 
 def get_soundings(
@@ -23,17 +41,35 @@ def get_soundings(
     driver="pandas",
     **kwargs,
 ):
+    """Load soundings via ``lair.soundings.get_soundings``.
+
+    Memoized per process (LRU, 4 entries) on the arguments so repeated calls
+    skip re-reading the sounding files; treat the returned data as read-only.
+    Calls with an open-ended range (``start`` or ``end`` None, i.e. whatever is
+    on disk) or with unhashable keyword arguments are not memoized. Call
+    ``get_soundings.cache_clear()`` after new sounding files land.
+    """
     if sounding_dir is None:
         sounding_dir = get_data_dir("SLV_SOUNDINGS_DIR")
-    return lair.soundings.get_soundings(
-        station=station,
-        start=start,
-        end=end,
-        sounding_dir=sounding_dir,
-        months=months,
-        driver=driver,
-        **kwargs,
+    key = (
+        station,
+        start,
+        end,
+        Path(sounding_dir),
+        None if months is None else tuple(months),
+        driver,
+        tuple(sorted(kwargs.items())),
     )
+    if start is None or end is None:
+        return _load_soundings.__wrapped__(*key)
+    try:
+        hash(key)
+    except TypeError:
+        return _load_soundings.__wrapped__(*key)
+    return _load_soundings(*key)
+
+
+get_soundings.cache_clear = _load_soundings.cache_clear
 
 
 def get_pcap_events(time_range, threshold=4.04, min_periods=3, sounding_kwargs=None):
@@ -55,9 +91,10 @@ def get_pcap_events(time_range, threshold=4.04, min_periods=3, sounding_kwargs=N
     If the environment variable ``SLV_USER_DATA_DIR`` is set, events are cached as
     ``$SLV_USER_DATA_DIR/pcap_events.csv`` and reloaded on subsequent calls.
     """
-    if PCAP_EVENTS_CSV is not None and PCAP_EVENTS_CSV.exists():
-        print(f"Loading cached PCAP events from {PCAP_EVENTS_CSV}")
-        return pd.read_csv(PCAP_EVENTS_CSV, parse_dates=["start", "end"])
+    events_csv = _pcap_events_csv()
+    if events_csv is not None and events_csv.exists():
+        print(f"Loading cached PCAP events from {events_csv}")
+        return pd.read_csv(events_csv, parse_dates=["start", "end"])
 
     driver = "xarray"  # Use xarray for aligned (interpolated values) soundings
     soundings = get_soundings(
@@ -68,15 +105,39 @@ def get_pcap_events(time_range, threshold=4.04, min_periods=3, sounding_kwargs=N
         vhd, threshold=threshold, min_periods=min_periods
     )
 
-    if PCAP_EVENTS_CSV is not None:
-        PCAP_EVENTS_CSV.parent.mkdir(parents=True, exist_ok=True)
-        print(f"Saving PCAP events to {PCAP_EVENTS_CSV}")
-        events.to_csv(PCAP_EVENTS_CSV, index=False)
+    if events_csv is not None:
+        events_csv.parent.mkdir(parents=True, exist_ok=True)
+        print(f"Saving PCAP events to {events_csv}")
+        events.to_csv(events_csv, index=False)
 
     return events
 
 
+def _in_events(times: pd.DatetimeIndex, events: pd.DataFrame) -> np.ndarray:
+    """Boolean mask of *times* falling inside any ``[start, end]`` event.
+
+    Events are sorted by start and the running maximum of their ends is taken,
+    so overlapping events are handled and each time needs a single
+    ``searchsorted`` into the starts -- O((N + E) log E) rather than a scan of
+    every event per call.
+    """
+    if events.empty:
+        return np.zeros(len(times), dtype=bool)
+    events = events.sort_values("start")
+    starts = events["start"].to_numpy(dtype="datetime64[ns]")
+    ends = np.maximum.accumulate(events["end"].to_numpy(dtype="datetime64[ns]"))
+    t = times.to_numpy(dtype="datetime64[ns]")
+    i = np.searchsorted(starts, t, side="right") - 1
+    return (i >= 0) & (t <= ends[np.clip(i, 0, None)])
+
+
 def filter_pcap_events(data: pd.Series | pd.DataFrame, level=None):
-    time_range = (data.index.min(), data.index.max())
+    """Drop rows of *data* whose time falls within a PCAP event.
+
+    Times come from the index, or from index level *level* for a MultiIndex.
+    """
+    times = data.index if level is None else data.index.get_level_values(level)
+    times = pd.DatetimeIndex(times)
+    time_range = (times.min(), times.max())
     events = get_pcap_events(time_range)
-    return lair.pcaps.filter_pcap_events(data, events=events, level=level)
+    return data[~_in_events(times, events)]
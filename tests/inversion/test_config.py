@@ -134,6 +134,19 @@ class TestInversionConfigTime:
         config = InversionConfig(tstart="2020-01-01", tend="2020-04-01", flux_freq="MS")
         assert len(config.flux_time_bins) == 3
 
+    def test_flux_bin_positions_match_intervals(self):
+        config = InversionConfig(tstart="2020-01-01", tend="2020-04-01", flux_freq="MS")
+        times = pd.to_datetime(
+            [
+                "2019-12-31 00:00",
+                "2020-01-01 00:00",
+                "2020-02-29 23:00",
+                "2020-04-01 00:00",
+            ]
+        )
+        expected = pd.cut(times, bins=config.flux_time_bins).codes
+        assert list(config.flux_bin_positions(times)) == list(expected)
+
     def test_subset_hours_utc_conversion(self):
         # Mountain Standard Time is UTC-7
         config = InversionConfig(subset_hours=[12, 13], utc_offset=-7)
@@ -144,6 +157,24 @@ class TestInversionConfigTime:
         # 23 - (-1) = 24 -> wraps to 0
         assert config.subset_hours_utc == [0]
 
+    def test_subset_hours_utc_tracks_reassigned_offset(self):
+        config = InversionConfig(subset_hours=[12], utc_offset=-7)
+        assert config.subset_hours_utc == [19]
+        config.utc_offset = -6
+        assert config.subset_hours_utc == [18]
+
+    def test_subset_hours_utc_tracks_in_place_edits(self):
+        config = InversionConfig(subset_hours=[12], utc_offset=-7)
+        assert config.subset_hours_utc == [19]
+        config.subset_hours.append(13)
+        assert config.subset_hours_utc == [19, 20]
+
+    def test_flux_times_track_reassigned_tend(self):
+        config = InversionConfig(tstart="2020-01-01", tend="2020-04-01", flux_freq="MS")
+        assert len(config.flux_times) == 3
+        config.tend = "2020-07-01"
+        assert len(config.flux_times) == 6
+
 
 # ---------------------------------------------------------------------------
 # InversionConfig — spatial properties
@@ -173,6 +204,23 @@ class TestInversionConfigSpatial:
     def test_resolution(self, config):
         assert config.resolution == "0.1x0.05"
 
+    def test_bbox_tracks_reassigned_bounds(self, config):
+        assert config.bbox == (-112.0, 39.0, -110.0, 41.0)
+        config.xmin = -113.0
+        assert config.bbox == (-113.0, 39.0, -110.0, 41.0)
+
+    def test_grid_coords_is_lon_lat_array(self, config):
+        coords = config.grid_coords
+        n_lon, n_lat = config.grid["lon"].size, config.grid["lat"].size
+        assert coords.shape == (n_lon * n_lat, 2)
+        assert coords[0, 0] == config.grid["lon"].values[0]
+        assert coords[1, 1] == config.grid["lat"].values[1]
+
+    def test_grid_coords_matches_multiindex_order(self, config):
+        assert config.grid_coords.tolist() == [
+            list(pair) for pair in config.grid_multiindex
+        ]
+
 
 # ---------------------------------------------------------------------------
 # InversionConfig — cache_overwrite variants
@@ -0,0 +1,65 @@
+"""Tests for the per-observation std lookups in build_mdm_error."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from slv.inversion.covariances import build_mdm_error
+
+
+@pytest.fixture
+def obs_index():
+    return pd.MultiIndex.from_product(
+        [["wbb", "hw"], pd.to_datetime(["2020-01-15", "2020-07-15"])],
+        names=["obs_location", "obs_time"],
+    )
+
+
+@pytest.fixture
+def site_config():
+    return pd.DataFrame({"organization": ["UATAQ", "DAQ"]}, index=["wbb", "hw"])
+
+
+class TestOrganizationStd:
+    def test_variances_per_organization(self, obs_index, site_config):
+        comp = build_mdm_error(
+            "instr",
+            obs_index,
+            std={"UATAQ": 1.0, "DAQ": 3.0},
+            correlated=False,
+            site_config=site_config,
+        )
+        np.testing.assert_array_equal(comp.variances.to_numpy(), [1, 1, 9, 9])
+
+    def test_site_missing_from_site_config_raises_key_error(self, obs_index):
+        site_config = pd.DataFrame({"organization": ["UATAQ"]}, index=["wbb"])
+        with pytest.raises(KeyError, match="hw"):
+            build_mdm_error(
+                "instr",
+                obs_index,
+                std={"UATAQ": 1.0},
+                correlated=False,
+                site_config=site_config,
+            )
+
+    def test_organization_without_std_raises_value_error(self, obs_index, site_config):
+        with pytest.raises(ValueError, match="organization='DAQ'"):
+            build_mdm_error(
+                "instr",
+                obs_index,
+                std={"UATAQ": 1.0},
+                correlated=False,
+                site_config=site_config,
+            )
+
+
+class TestSiteSeasonStd:
+    def test_variances_per_site_and_season(self, obs_index):
+        std = {"wbb": {"DJF": 1.0, "JJA": 2.0}, "hw": {"DJF": 3.0, "JJA": 4.0}}
+        comp = build_mdm_error("transport", obs_index, std=std, correlated=False)
+        np.testing.assert_array_equal(comp.variances.to_numpy(), [1, 4, 9, 16])
+
+    def test_missing_season_raises_value_error(self, obs_index):
+        std = {"wbb": {"DJF": 1.0, "JJA": 2.0}, "hw": {"DJF": 3.0}}
+        with pytest.raises(ValueError, match="site='hw', season='JJA'"):
+            build_mdm_error("transport", obs_index, std=std, correlated=False)
@@ -0,0 +1,44 @@
+"""Tests for the keyed LRU memoization helper."""
+
+import pandas as pd
+
+from slv.inversion.memo import keyed_lru_cache
+
+
+def make_cached(maxsize=2):
+    calls = []
+
+    @keyed_lru_cache(maxsize=maxsize, key=lambda df, scale=1: (df.shape, scale))
+    def build(df, scale=1):
+        calls.append((df.shape, scale))
+        return df * scale
+
+    return build, calls
+
+
+class TestKeyedLruCache:
+    def test_unhashable_arguments_are_memoized_on_key(self):
+        build, calls = make_cached()
+        df = pd.DataFrame({"a": [1.0, 2.0]})
+        first = build(df, scale=2)
+        assert build(df.copy(), scale=2) is first
+        assert calls == [((2, 1), 2)]
+
+    def test_evicts_least_recently_used(self):
+        build, calls = make_cached(maxsize=2)
+        df = pd.DataFrame({"a": [1.0]})
+        build(df, 1)
+        build(df, 2)
+        build(df, 1)  # refresh 1, so 2 is the oldest
+        build(df, 3)  # evicts 2
+        build(df, 1)
+        build(df, 2)
+        assert [scale for _, scale in calls] == [1, 2, 3, 2]
+
+    def test_cache_clear(self):
+        build, calls = make_cached()
+        df = pd.DataFrame({"a": [1.0]})
+        build(df)
+        build.cache_clear()
+        build(df)
+        assert len(calls) == 2
@@ -3,10 +3,13 @@
 import pickle
 from unittest.mock import MagicMock
 
+import numpy as np
 import pandas as pd
 import pytest
+from fips.problems.flux import FluxInversionPipeline
 
-from slv.inversion.config import InversionConfig
+from slv.inversion import pipelines
+from slv.inversion.config import DEFAULT_MDM_CONFIG, InversionConfig
 from slv.inversion.pipelines import (
     SLVMethaneInversion,
     fips_cache,
@@ -33,8 +36,8 @@ def make_obs_vector(locations, times):
     mock_block.index = index
 
     mock_vector = MagicMock()
-    mock_vector.__getitem__ = (
-        lambda self, key: mock_block if key == "concentration" else None
+    mock_vector.__getitem__ = lambda self, key: (
+        mock_block if key == "concentration" else None
     )
     return mock_vector
 
@@ -435,7 +438,7 @@ class TestBiasIntegration:
     def test_bias_std_affects_cache_key(self, pipeline):
         """Test that changing bias_std invalidates cache."""
         # This indirectly tests that COMPONENT_DEPS includes bias_std
-        # for prior, forward_operator, and prior_error
+        # for prior and prior_error
         bias1 = pipeline.get_bias()
         pipeline.config.bias_std = 1.0
         bias2 = pipeline.get_bias()
@@ -444,3 +447,245 @@ class TestBiasIntegration:
         # or same structure but we just verify the method runs
         assert isinstance(bias1, pd.Series)
         assert isinstance(bias2, pd.Series)
+
+
+# ---------------------------------------------------------------------------
+# SLVMethaneInversion.get_inputs
+# ---------------------------------------------------------------------------
+
+
+class TestGetInputs:
+    """The concurrent get_inputs matches the sequential base implementation."""
+
+    @pytest.fixture
+    def pipeline(self, monkeypatch):
+        pipeline = SLVMethaneInversion(
+            InversionConfig(
+                tstart="2020-01-01",
+                tend="2020-04-01",
+                flux_freq="MS",
+                num_processes=3,
+            )
+        )
+
+        # Each fake builder tags its output with its inputs, so the result
+        # records exactly which values flowed into each step
+        def aggregate(obs, forward_operator, modeldata_mismatch, constant):
+            parts = (obs, forward_operator, modeldata_mismatch, constant)
+            return tuple(("aggregated", x) for x in parts)
+
+        builders = {
+            "get_obs": lambda: "obs",
+            "get_prior": lambda: "prior",
+            "get_constant": lambda obs: ("constant", obs),
+            "filter_state_space": lambda obs, prior: (
+                ("filtered", obs),
+                ("filtered", prior),
+            ),
+            "get_forward_operator": lambda obs, prior: ("H", obs, prior),
+            "get_prior_error": lambda prior: ("S_0", prior),
+            "get_modeldata_mismatch": lambda obs: ("S_z", obs),
+            "aggregate_obs_space": aggregate,
+        }
+        for name, func in builders.items():
+            monkeypatch.setattr(pipeline, name, func)
+        return pipeline
+
+    def test_matches_sequential_get_inputs(self, pipeline):
+        expected = FluxInversionPipeline.get_inputs(pipeline)
+        assert pipeline.get_inputs() == expected
+
+    def test_records_stage_timings(self, pipeline):
+        pipeline.get_inputs()
+        assert set(pipeline.timings) == {
+            "obs",
+            "prior",
+            "constant",
+            "filter_state_space",
+            "forward_operator",
+            "prior_error",
+            "modeldata_mismatch",
+            "aggregate_obs_space",
+        }
+        assert all(t >= 0 for t in pipeline.timings.values())
+
+    def test_mdm_plot_saved_from_main_thread(
+        self, pipeline, monkeypatch, fake_mdm, obs_index, tmp_path
+    ):
+        import threading
+
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        from slv.inversion import viz
+
+        pipeline.config.plot_diagnostics = True
+        pipeline.config.save_figures = tmp_path
+        obs = MagicMock(index=obs_index)
+        monkeypatch.setattr(pipeline, "get_obs", lambda: obs)
+        monkeypatch.setattr(
+            pipeline, "filter_state_space", lambda obs, prior: (obs, prior)
+        )
+        monkeypatch.delattr(pipeline, "get_modeldata_mismatch")  # the real one
+        pipeline.get_inputs()
+        assert plt.get_fignums() == []
+
+        # Only the MDM plot is drawn for real; record which thread draws it
+        threads = []
+        plot_mdm_components = viz.plot_mdm_components
+
+        def record_thread(components):
+            threads.append(threading.current_thread())
+            return plot_mdm_components(components)
+
+        monkeypatch.setattr(viz, "plot_mdm_components", record_thread)
+        monkeypatch.setattr(viz, "plot_fluxes_by_timestep", MagicMock())
+        monkeypatch.setattr(viz, "plot_desroziers", MagicMock())
+        monkeypatch.setattr(pipeline, "desroziers_diagnostic", MagicMock())
+        pipeline.plot_diagnostics(MagicMock())
+
+        assert threads == [threading.main_thread()]
+        assert len(list(tmp_path.glob("diagnostics_*.png"))) == 1
+        assert plt.get_fignums() == []
+
+
+# ---------------------------------------------------------------------------
+# SLVMethaneInversion plotting helpers
+# ---------------------------------------------------------------------------
+
+
+class TestPlottingEnabled:
+    @pytest.fixture
+    def pipeline(self):
+        return make_pipeline(SLVMethaneInversion)
+
+    @pytest.fixture
+    def backend(self, monkeypatch):
+        import matplotlib
+
+        def set_backend(name):
+            monkeypatch.setattr(matplotlib, "get_backend", lambda: name)
+
+        return set_backend
+
+    def test_flag_off(self, pipeline, backend):
+        backend("QtAgg")
+        assert not pipeline._plotting_enabled(False)
+
+    def test_interactive_backend(self, pipeline, backend):
+        backend("QtAgg")
+        assert pipeline._plotting_enabled(True)
+
+    def test_non_interactive_backend_skipped(self, pipeline, backend):
+        backend("Agg")
+        assert not pipeline._plotting_enabled(True)
+
+    def test_non_interactive_backend_with_save_dir(self, pipeline, backend, tmp_path):
+        backend("Agg")
+        pipeline.config.save_figures = tmp_path
+        assert pipeline._plotting_enabled(True)
+
+
+class TestFigures:
+    @pytest.fixture
+    def plt(self):
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        yield plt
+        plt.close("all")
+
+    def test_saves_and_closes_only_new_figures(self, plt, tmp_path):
+        pipeline = make_pipeline(SLVMethaneInversion, save_figures=tmp_path / "figs")
+        existing = plt.figure()
+
+        with pipeline._figures("results"):
+            plt.figure("total fluxes")
+            unlabeled = plt.figure()
+
+        assert sorted(p.name for p in (tmp_path / "figs").iterdir()) == sorted(
+            ["results_total_fluxes.png", f"results_{unlabeled.number}.png"]
+        )
+        assert plt.get_fignums() == [existing.number]
+
+    def test_shows_without_save_dir(self, plt, monkeypatch):
+        pipeline = make_pipeline(SLVMethaneInversion)
+        shown = MagicMock()
+        monkeypatch.setattr(plt, "show", shown)
+
+        with pipeline._figures("inputs"):
+            plt.figure()
+
+        shown.assert_called_once()
+        assert len(plt.get_fignums()) == 1
+
+
+# ---------------------------------------------------------------------------
+# SLVMethaneInversion.get_modeldata_mismatch
+# ---------------------------------------------------------------------------
+
+
+class FakeMdmComponent:
+    """Diagonal MDM component with a per-component variance."""
+
+    def __init__(self, name, variance):
+        self.name = name
+        self.variance = variance
+
+    def build(self, index):
+        return pd.DataFrame(
+            np.diag(np.full(len(index), self.variance)), index=index, columns=index
+        )
+
+
+@pytest.fixture
+def fake_mdm(monkeypatch):
+    """Replace build_mdm_error with FakeMdmComponent; variances are 1, 2, ..."""
+    variances = {name: i + 1.0 for i, name in enumerate(DEFAULT_MDM_CONFIG)}
+    monkeypatch.setattr(
+        pipelines,
+        "build_mdm_error",
+        lambda name, obs_index, site_config, **kwargs: FakeMdmComponent(
+            name, variances[name]
+        ),
+    )
+    return variances
+
+
+@pytest.fixture
+def obs_index():
+    return pd.MultiIndex.from_product(
+        [
+            ["concentration"],
+            ["wbb", "hw"],
+            pd.date_range("2020-01-01", periods=3, freq="h"),
+        ],
+        names=["block", "obs_location", "obs_time"],
+    )
+
+
+class TestGetModeldataMismatch:
+    def make(self, **config_kwargs):
+        return SLVMethaneInversion(
+            InversionConfig(tstart="2020-01-01", tend="2020-04-01", **config_kwargs)
+        )
+
+    @pytest.mark.parametrize("num_processes", [1, 4])
+    def test_sums_components(self, fake_mdm, obs_index, num_processes):
+        pipeline = self.make(num_processes=num_processes)
+        mdm = pipeline.get_modeldata_mismatch(obs=MagicMock(index=obs_index))
+        expected = np.eye(len(obs_index)) * sum(fake_mdm.values())
+        np.testing.assert_array_equal(mdm.data.to_numpy(), expected)
+
+    def test_single_process_builds_serially(self, fake_mdm, obs_index, monkeypatch):
+        def no_parallel(*args, **kwargs):
+            raise AssertionError("joblib used with num_processes=1")
+
+        monkeypatch.setattr(pipelines, "Parallel", no_parallel)
+        monkeypatch.setattr("slv.inversion.viz.plot_mdm_components", MagicMock())
+        pipeline = self.make(num_processes=1, plot_diagnostics=True)
+        pipeline.get_modeldata_mismatch(obs=MagicMock(index=obs_index))
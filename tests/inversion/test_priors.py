@@ -0,0 +1,43 @@
+"""Tests for the EPA sector-total helpers in inversion.priors."""
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from slv.inversion.priors import _add_annual_total
+
+
+def total(times, values, lat=(40.5, 40.6)):
+    data = np.asarray(values, dtype=float)[:, None] * np.ones(len(lat))
+    return xr.DataArray(
+        data,
+        coords={"time": pd.DatetimeIndex(times), "lat": list(lat)},
+        dims=["time", "lat"],
+        name="flux",
+        attrs={"units": "umol/m2/s"},
+    )
+
+
+class TestAddAnnualTotal:
+    def test_annual_forward_filled_to_monthly(self):
+        monthly = total(pd.date_range("2020-01-01", periods=14, freq="MS"), range(14))
+        annual = total(["2020-01-01", "2021-01-01"], [100, 200])
+        result = _add_annual_total(monthly, annual)
+        expected = np.arange(14) + np.r_[[100] * 12, [200] * 2]
+        np.testing.assert_array_equal(result.isel(lat=0).values, expected)
+        assert result.name == "flux"
+        assert result.attrs == {"units": "umol/m2/s"}
+
+    def test_annual_starting_after_monthly_keeps_monthly(self):
+        monthly = total(pd.date_range("2019-11-01", periods=4, freq="MS"), [1, 2, 3, 4])
+        annual = total(["2020-01-01"], [10])
+        result = _add_annual_total(monthly, annual)
+        np.testing.assert_array_equal(result.isel(lat=0).values, [1, 2, 13, 14])
+
+    def test_outer_join_on_grid(self):
+        times = pd.date_range("2020-01-01", periods=2, freq="MS")
+        monthly = total(times, [1, 2], lat=(40.5, 40.6))
+        annual = total(["2020-01-01"], [10], lat=(40.6, 40.7))
+        result = _add_annual_total(monthly, annual)
+        np.testing.assert_array_equal(result["lat"], [40.5, 40.6, 40.7])
+        np.testing.assert_array_equal(result.values, [[1, 11, 10], [2, 12, 10]])
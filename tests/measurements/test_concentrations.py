@@ -0,0 +1,28 @@
+"""Tests for the hour-of-day filtering helpers in measurements.concentrations."""
+
+import numpy as np
+import pandas as pd
+
+from slv.measurements.concentrations import _in_hours, _mst_to_utc_hours
+
+
+class TestInHours:
+    def test_matches_dt_hour_isin(self):
+        times = pd.Series(pd.date_range("2024-01-01", periods=72, freq="37min"))
+        hours = [0, 5, 17, 23]
+        expected = times.dt.hour.isin(hours).to_numpy()
+        np.testing.assert_array_equal(_in_hours(times, hours), expected)
+
+    def test_nat_is_dropped(self):
+        times = pd.Series(
+            [pd.Timestamp("2024-01-01 00:30"), pd.NaT, pd.Timestamp("2024-01-01 01:30")]
+        )
+        np.testing.assert_array_equal(_in_hours(times, [0]), [True, False, False])
+
+
+class TestMstToUtcHours:
+    def test_offsets_and_wraps_valid_hours(self):
+        assert _mst_to_utc_hours([0, 16, 17, 23]) == [7, 23, 0, 6]
+
+    def test_out_of_range_hours_are_dropped(self):
+        assert _mst_to_utc_hours([-1, 12, 24]) == [19]
@@ -0,0 +1,37 @@
+"""Tests for the column-wise interpolation helper in measurements.wyoming."""
+
+import numpy as np
+
+from slv.measurements.wyoming import _interp_columns
+
+
+def reference(x, xp, fp):
+    """Per-column ``np.interp``."""
+    return np.column_stack([np.interp(x, xp, fp[:, j]) for j in range(fp.shape[1])])
+
+
+class TestInterpColumns:
+    def test_matches_np_interp_with_nans(self):
+        rng = np.random.default_rng(0)
+        xp = np.sort(rng.uniform(0, 10, 12))
+        fp = rng.normal(size=(12, 4))
+        fp[[0, 3, 4, 11], [0, 1, 1, 2]] = np.nan
+        fp[6, :] = np.nan
+        # Interior points, points outside xp, and points exactly on xp
+        x = np.concatenate([rng.uniform(-2, 12, 50), xp, [xp[0] - 1, xp[-1] + 1]])
+        np.testing.assert_allclose(
+            _interp_columns(x, xp, fp), reference(x, xp, fp), rtol=1e-12
+        )
+
+    def test_nan_neighbour_not_used_at_endpoints(self):
+        xp = np.array([0.0, 1.0, 2.0, 3.0])
+        fp = np.array([[1.0], [np.nan], [3.0], [np.nan]])
+        x = np.array([-1.0, 0.0, 2.0])
+        np.testing.assert_array_equal(_interp_columns(x, xp, fp)[:, 0], [1.0, 1.0, 3.0])
+
+    def test_single_sample(self):
+        x = np.array([-1.0, 0.0, 5.0])
+        fp = np.array([[2.0, np.nan]])
+        np.testing.assert_array_equal(
+            _interp_columns(x, np.array([0.0]), fp), reference(x, np.array([0.0]), fp)
+        )
@@ -0,0 +1,124 @@
+"""Tests for PCAP event filtering and sounding memoization."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from slv.meteorology import pcaps
+from slv.meteorology.pcaps import _in_events, filter_pcap_events, get_soundings
+
+
+@pytest.fixture
+def events():
+    """Two overlapping events (the first outlasts the second) and a later one."""
+    return pd.DataFrame(
+        {
+            "start": pd.to_datetime(
+                ["2024-01-05 00:00", "2024-01-01 00:00", "2024-01-02 00:00"]
+            ),
+            "end": pd.to_datetime(
+                ["2024-01-06 00:00", "2024-01-03 00:00", "2024-01-02 12:00"]
+            ),
+        }
+    )
+
+
+def reference(times, events):
+    """Naive per-event scan: inside ``[start, end]`` of any event."""
+    inside = np.zeros(len(times), dtype=bool)
+    for start, end in zip(events["start"], events["end"], strict=True):
+        inside |= (times >= start) & (times <= end)
+    return inside
+
+
+class TestInEvents:
+    def test_matches_reference_scan(self, events):
+        times = pd.date_range("2023-12-31", "2024-01-07", freq="3h")
+        np.testing.assert_array_equal(
+            _in_events(times, events), reference(times, events)
+        )
+
+    def test_boundaries_are_inclusive(self, events):
+        times = pd.DatetimeIndex(events["start"].tolist() + events["end"].tolist())
+        assert _in_events(times, events).all()
+
+    def test_overlap_uses_longest_running_event(self, events):
+        # After the nested event ends, still inside the one that started first
+        times = pd.to_datetime(["2024-01-02 18:00", "2024-01-03 00:01"])
+        np.testing.assert_array_equal(_in_events(times, events), [True, False])
+
+    def test_times_before_first_event(self, events):
+        times = pd.to_datetime(["2023-06-01 00:00", "2023-12-31 23:59"])
+        assert not _in_events(times, events).any()
+
+    def test_no_events(self):
+        times = pd.date_range("2024-01-01", periods=4, freq="D")
+        empty = pd.DataFrame(
+            {"start": pd.DatetimeIndex([]), "end": pd.DatetimeIndex([])}
+        )
+        assert not _in_events(times, empty).any()
+
+
+class TestFilterPcapEvents:
+    @pytest.fixture(autouse=True)
+    def fake_events(self, monkeypatch, events):
+        monkeypatch.setattr(pcaps, "get_pcap_events", lambda time_range: events)
+
+    def test_drops_rows_in_events(self, events):
+        times = pd.date_range("2023-12-31", "2024-01-07", freq="6h")
+        data = pd.Series(np.arange(len(times)), index=times)
+        filtered = filter_pcap_events(data)
+        pd.testing.assert_series_equal(filtered, data[~reference(times, events)])
+
+    def test_multiindex_level(self, events):
+        times = pd.date_range("2023-12-31", "2024-01-07", freq="6h")
+        index = pd.MultiIndex.from_product(
+            [["wbb", "hw"], times], names=["site", "obs_time"]
+        )
+        data = pd.DataFrame({"CH4": np.arange(len(index), dtype=float)}, index=index)
+        filtered = filter_pcap_events(data, level="obs_time")
+        keep = ~reference(index.get_level_values("obs_time"), events)
+        pd.testing.assert_frame_equal(filtered, data[keep])
+
+
+class TestGetSoundings:
+    @pytest.fixture(autouse=True)
+    def calls(self, monkeypatch):
+        calls = []
+
+        def fake_get_soundings(**kwargs):
+            calls.append(kwargs)
+            return pd.DataFrame({"call": [len(calls)]})
+
+        monkeypatch.setattr(pcaps.lair.soundings, "get_soundings", fake_get_soundings)
+        get_soundings.cache_clear()
+        yield calls
+        get_soundings.cache_clear()
+
+    def test_repeated_call_hits_cache(self, calls, tmp_path):
+        kwargs = dict(start="2020-01-01", end="2020-02-01", sounding_dir=tmp_path)
+        first = get_soundings(**kwargs)
+        assert get_soundings(**kwargs) is first
+        assert len(calls) == 1
+
+    def test_cache_clear_reloads(self, calls, tmp_path):
+        kwargs = dict(start="2020-01-01", end="2020-02-01", sounding_dir=tmp_path)
+        get_soundings(**kwargs)
+        get_soundings.cache_clear()
+        get_soundings(**kwargs)
+        assert len(calls) == 2
+
+    @pytest.mark.parametrize(
+        "bounds", [dict(start="2020-01-01"), dict(end="2020-02-01"), dict()]
+    )
+    def test_open_ended_range_bypasses_cache(self, calls, tmp_path, bounds):
+        get_soundings(sounding_dir=tmp_path, **bounds)
+        get_soundings(sounding_dir=tmp_path, **bounds)
+        assert len(calls) == 2
+
+    def test_unhashable_kwargs_bypass_cache(self, calls, tmp_path):
+        kwargs = dict(start="2020-01-01", end="2020-02-01", sounding_dir=tmp_path)
+        get_soundings(levels=[700, 500], **kwargs)
+        get_soundings(levels=[700, 500], **kwargs)
+        assert len(calls) == 2
+        assert calls[0]["levels"] == [700, 500]